@@ -13,20 +13,38 @@ __version__ = "1.0.0"
 __author__ = "OpenClaw Agent"
 __license__ = "MIT"
 
-from config import Config, ConfigManager
-from wallet import SecureWallet
-from trader import ComputeTrader
-from utils import (
-    logger,
-    GasOptimizer,
-    HealthMonitor,
-    format_wei,
-    format_eth,
-    format_duration,
-    TransactionError,
-    InsufficientFundsError,
-    GasPriceError,
-)
+import importlib
+
+# Public name -> module that defines it. Resolved on first access (PEP 562) so
+# importing the package doesn't pull in web3, eth_account and cryptography.
+_LAZY_ATTRS = {
+    "Config": "config",
+    "ConfigManager": "config",
+    "SecureWallet": "wallet",
+    "ComputeTrader": "trader",
+    "logger": "utils",
+    "GasOptimizer": "utils",
+    "HealthMonitor": "utils",
+    "format_wei": "utils",
+    "format_eth": "utils",
+    "format_duration": "utils",
+    "TransactionError": "utils",
+    "InsufficientFundsError": "utils",
+    "GasPriceError": "utils",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_ATTRS))
 
 __all__ = [
     "Config",
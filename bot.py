@@ -39,12 +39,16 @@ from oneinch_router import OneInchAggregator
 from dex_router import MultiDEXRouter
 from zerox_router import ZeroXAggregator
 from v4_router import V4DirectRouter
+from multicall import get_erc20_metadata
 
 # Constants
 COMPUTE_TOKEN = "0x696381f39F17cAD67032f5f52A4924ce84e51BA3"
 WETH = "0x4200000000000000000000000000000000000006"
 USDC = "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913"
 
+# Persisted token symbol/decimals, keyed by "chain:address" (ERC20 metadata never changes)
+TOKEN_CACHE_FILE = Path("~/.cache/base-volume-bot/token_cache.json").expanduser()
+
 RPC_URLS = {
     "base": [
         # NOTE: Rate limit considerations:
@@ -203,6 +207,8 @@ class VolumeBot:
 
         self.base_token_symbol = "ETH"
         self.quote_token_symbol = "TOKEN"
+        self.base_token_decimals: Optional[int] = 18
+        self.quote_token_decimals: Optional[int] = None
 
         self.w3: Optional[Web3] = None
         self.account: Optional[Account] = None
@@ -212,6 +218,7 @@ class VolumeBot:
         self.v4_router: Optional[Any] = None
         self.base_token_contract = None
         self.quote_token_contract = None
+        self.token_cache: Dict[str, Dict[str, Any]] = self._load_token_cache()
 
         # Stats (backward compatible - total_bought_eth is alias for total_bought_base)
         self.cycle_count = 0
@@ -269,19 +276,19 @@ class VolumeBot:
                 address=self.w3.to_checksum_address(self.base_token),
                 abi=ERC20_ABI
             )
-            try:
-                self.base_token_symbol = self.base_token_contract.functions.symbol().call()
-            except:
-                self.base_token_symbol = "BASE"
+            self.base_token_symbol, self.base_token_decimals = self._load_token_metadata(
+                self.base_token_contract, "BASE"
+            )
 
+        # Checksum once here - routers and contracts below reuse it as-is
+        self.quote_token = self.w3.to_checksum_address(self.quote_token)
         self.quote_token_contract = self.w3.eth.contract(
-            address=self.w3.to_checksum_address(self.quote_token),
+            address=self.quote_token,
             abi=ERC20_ABI
         )
-        try:
-            self.quote_token_symbol = self.quote_token_contract.functions.symbol().call()
-        except:
-            self.quote_token_symbol = "QUOTE"
+        self.quote_token_symbol, self.quote_token_decimals = self._load_token_metadata(
+            self.quote_token_contract, "QUOTE"
+        )
 
         # Setup DEX routers
         router_type = getattr(self.config, 'router_type', '0x')
@@ -327,6 +334,51 @@ class VolumeBot:
         console.print(f"[green]✓ Connected successfully[/green]")
         return True
 
+    def _load_token_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load persisted token metadata from disk"""
+        try:
+            with open(TOKEN_CACHE_FILE, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_token_cache(self):
+        """Persist token metadata (write to a temp file, then atomically replace)"""
+        tmp_file = TOKEN_CACHE_FILE.with_name(TOKEN_CACHE_FILE.name + ".tmp")
+        try:
+            TOKEN_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, 'w') as f:
+                json.dump(self.token_cache, f, indent=2)
+            os.replace(tmp_file, TOKEN_CACHE_FILE)
+        except OSError as e:
+            self.logger.warning(f"Could not save token cache: {e}")
+
+    def _load_token_metadata(self, contract, default_symbol: str) -> Tuple[str, Optional[int]]:
+        """Fetch symbol and decimals (disk cache, then one multicall round trip, then per-call)"""
+        cache_key = f"{self.config.chain}:{contract.address}"
+        cached = self.token_cache.get(cache_key)
+        if cached:
+            return cached["symbol"], cached["decimals"]
+
+        try:
+            symbol, decimals = get_erc20_metadata(self.w3, contract.address)
+        except Exception:
+            symbol = decimals = None
+            try:
+                symbol = contract.functions.symbol().call()
+            except:
+                pass
+            try:
+                decimals = contract.functions.decimals().call()
+            except:
+                pass
+
+        # Only persist complete lookups so a flaky RPC doesn't pin the defaults
+        if symbol and decimals is not None:
+            self.token_cache[cache_key] = {"symbol": symbol, "decimals": decimals}
+            self._save_token_cache()
+        return symbol or default_symbol, decimals
+
     def get_eth_balance(self) -> Decimal:
         """Get ETH balance"""
         if not self.w3 or not self.account:
@@ -345,11 +397,9 @@ class VolumeBot:
 
         if self.base_token_contract:
             balance = self.base_token_contract.functions.balanceOf(self.account.address).call()
-            try:
-                decimals = self.base_token_contract.functions.decimals().call()
-                return Decimal(balance) / Decimal(10 ** decimals)
-            except:
+            if self.base_token_decimals is None:
                 return Decimal(balance)
+            return Decimal(balance).scaleb(-self.base_token_decimals)
         return Decimal("0")
 
     def get_quote_balance(self) -> Decimal:
@@ -358,11 +408,9 @@ class VolumeBot:
             return Decimal("0")
 
         balance = self.quote_token_contract.functions.balanceOf(self.account.address).call()
-        try:
-            decimals = self.quote_token_contract.functions.decimals().call()
-            return Decimal(balance) / Decimal(10 ** decimals)
-        except:
+        if self.quote_token_decimals is None:
             return Decimal(balance)
+        return Decimal(balance).scaleb(-self.quote_token_decimals)
 
     def get_token_balance(self, token_address: str = None) -> Decimal:
         """Get token balance"""
@@ -382,7 +430,7 @@ class VolumeBot:
         balance = token.functions.balanceOf(self.account.address).call()
         decimals = token.functions.decimals().call()
 
-        return Decimal(balance) / Decimal(10 ** decimals)
+        return Decimal(balance).scaleb(-decimals)
 
     def execute_buy(self) -> bool:
         """Execute buy transaction"""
@@ -487,8 +535,10 @@ class VolumeBot:
             
             console.print(f"[dim]Selling {quote_balance:.4f} {self.quote_token_symbol}...[/dim]")
 
-            # Get token decimals
-            token_decimals = self.quote_token_contract.functions.decimals().call()
+            # Token decimals were read once in connect()
+            token_decimals = self.quote_token_decimals
+            if token_decimals is None:
+                token_decimals = self.quote_token_contract.functions.decimals().call()
             
             # Route based on configured router type
             router_type = getattr(self.config, 'router_type', '0x')
@@ -630,7 +680,7 @@ class VolumeBot:
                 console.print(f"\n[dim]Sending {compute_balance:.6f} ${self.token_symbol}...[/dim]")
 
                 decimals = self.token_contract.functions.decimals().call()
-                amount_units = int(compute_balance * (10 ** decimals))
+                amount_units = int(compute_balance.scaleb(decimals))
 
                 tx = self.token_contract.functions.transfer(to_address, amount_units).build_transaction({
                     'from': self.account.address,
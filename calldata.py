@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Hand-Built Calldata
+===================
+Precomputed selectors and bound argument encoders shared by the routers,
+the trader and the Multicall3 helpers. Resolving an encoder once skips the
+type parsing and TupleEncoder build that eth_abi.encode (and
+build_transaction) repeat on every call.
+"""
+
+from eth_abi.registry import registry as abi_registry
+
+# Unlimited approval - granted once per spender so later sells skip approve
+MAX_UINT256 = 2**256 - 1
+
+# ERC20
+APPROVE_SELECTOR = bytes.fromhex("095ea7b3")  # approve(address,uint256)
+APPROVE_ARGS_ENCODER = abi_registry.get_encoder("(address,uint256)")
+DECIMALS_SELECTOR = bytes.fromhex("313ce567")  # decimals()
+SYMBOL_SELECTOR = bytes.fromhex("95d89b41")  # symbol()
+SYMBOL_RESULT_TYPES = ("string",)
+DECIMALS_RESULT_TYPES = ("uint8",)
+BALANCE_OF_SELECTOR = bytes.fromhex("70a08231")  # balanceOf(address)
+BALANCE_OF_ARGS_ENCODER = abi_registry.get_encoder("(address)")
+UINT256_RESULT_TYPES = ("uint256",)
+
+# exactInputSingle((tokenIn,tokenOut,fee,recipient,deadline,amountIn,amountOutMinimum,sqrtPriceLimitX96))
+EXACT_INPUT_SINGLE_SELECTOR = bytes.fromhex("414bf389")
+EXACT_INPUT_SINGLE_ARGS_ENCODER = abi_registry.get_encoder(
+    "((address,address,uint24,address,uint256,uint256,uint256,uint160))"
+)
+# Struct field names, in ABI order
+EXACT_INPUT_SINGLE_FIELDS = (
+    "tokenIn",
+    "tokenOut",
+    "fee",
+    "recipient",
+    "deadline",
+    "amountIn",
+    "amountOutMinimum",
+    "sqrtPriceLimitX96",
+)
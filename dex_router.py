@@ -13,12 +13,28 @@ Supported DEXs:
 Automatically queries liquidity and selects best route.
 """
 
-from typing import Optional, Tuple, Dict, List
+import logging
+import time
+from typing import Optional, Tuple, Dict, List, NamedTuple
 from decimal import Decimal
 from dataclasses import dataclass
+from eth_abi import decode
+from eth_abi.registry import registry as abi_registry
 from web3 import Web3
+from web3.exceptions import TimeExhausted, TransactionNotFound
 from eth_account import Account
 
+from calldata import (
+    APPROVE_ARGS_ENCODER,
+    APPROVE_SELECTOR,
+    EXACT_INPUT_SINGLE_ARGS_ENCODER,
+    EXACT_INPUT_SINGLE_SELECTOR,
+    MAX_UINT256,
+)
+from multicall import multicall
+
+logger = logging.getLogger(__name__)
+
 
 # DEX Configuration
 DEX_CONFIG = {
@@ -59,6 +75,12 @@ DEX_CONFIG = {
     }
 }
 
+# Checksum router/factory addresses once at import instead of on every lookup
+for _dex_info in DEX_CONFIG.values():
+    _dex_info["router"] = Web3.to_checksum_address(_dex_info["router"])
+    _dex_info["factory"] = Web3.to_checksum_address(_dex_info["factory"])
+del _dex_info
+
 # Aerodrome Router ABI (Solidly-style with Route struct)
 AERODROME_ROUTER_ABI = [
     {
@@ -290,6 +312,7 @@ ERC20_ABI = [
     {"constant": True, "inputs": [], "name": "decimals", "outputs": [{"name": "", "type": "uint8"}], "type": "function"},
     {"constant": True, "inputs": [{"name": "_owner", "type": "address"}], "name": "balanceOf", "outputs": [{"name": "balance", "type": "uint256"}], "type": "function"},
     {"constant": False, "inputs": [{"name": "_spender", "type": "address"}, {"name": "_value", "type": "uint256"}], "name": "approve", "outputs": [{"name": "", "type": "bool"}], "type": "function"},
+    {"constant": True, "inputs": [{"name": "_owner", "type": "address"}, {"name": "_spender", "type": "address"}], "name": "allowance", "outputs": [{"name": "", "type": "uint256"}], "type": "function"},
 ]
 
 # WETH ABI (for wrapping/unwrapping)
@@ -303,7 +326,59 @@ WETH_ABI = [
 ]
 
 # WETH address on Base
-WETH = "0x4200000000000000000000000000000000000006"
+WETH = Web3.to_checksum_address("0x4200000000000000000000000000000000000006")
+
+# Returned by factory getPool when no pool exists
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+# How long fetched EIP-1559 fee params are reused across back-to-back swaps
+FEE_PARAMS_TTL_SECONDS = 2.0
+
+# Priority fee (tip) in wei - ~0.001 gwei is plenty on Base
+PRIORITY_FEE_WEI = 1_000_000
+
+# Receipt polling: start fast (Base blocks are ~2s), back off to spare the RPC
+RECEIPT_TIMEOUT_SECONDS = 120
+RECEIPT_POLL_INITIAL_SECONDS = 0.25
+RECEIPT_POLL_MAX_SECONDS = 2.0
+
+# Headroom on a swap shape's first gas estimate, reused for later swaps of that shape
+GAS_ESTIMATE_BUFFER = 1.25
+
+# Router-specific selectors and bound argument encoders for hand-built calldata
+# (shared ERC20 / exactInputSingle ones live in calldata.py)
+DEPOSIT_SELECTOR = bytes.fromhex("d0e30db0")  # deposit()
+
+# V3 factory getPool(address,address,uint24), batched across fee tiers via Multicall3
+V3_GET_POOL_SELECTOR = bytes.fromhex("1698ee82")
+V3_GET_POOL_ARGS_ENCODER = abi_registry.get_encoder("(address,address,uint24)")
+ADDRESS_RESULT_TYPES = ("address",)
+
+# V2 / Aerodrome swap entry points, encoded by hand instead of via contract functions
+V2_SWAP_EXACT_ETH_FOR_TOKENS_SELECTOR = bytes.fromhex("7ff36ab5")
+V2_SWAP_EXACT_ETH_FOR_TOKENS_ARGS_ENCODER = abi_registry.get_encoder("(uint256,address[],address,uint256)")
+V2_SWAP_EXACT_TOKENS_FOR_ETH_SELECTOR = bytes.fromhex("18cbafe5")
+V2_SWAP_EXACT_TOKENS_FOR_ETH_ARGS_ENCODER = abi_registry.get_encoder("(uint256,uint256,address[],address,uint256)")
+AERODROME_SWAP_EXACT_ETH_FOR_TOKENS_SELECTOR = bytes.fromhex("903638a4")
+AERODROME_SWAP_EXACT_ETH_FOR_TOKENS_ARGS_ENCODER = abi_registry.get_encoder(
+    "(uint256,(address,address,bool,address)[],address,uint256)"
+)
+AERODROME_SWAP_EXACT_TOKENS_FOR_ETH_SELECTOR = bytes.fromhex("c6b7f1b6")
+AERODROME_SWAP_EXACT_TOKENS_FOR_ETH_ARGS_ENCODER = abi_registry.get_encoder(
+    "(uint256,uint256,(address,address,bool,address)[],address,uint256)"
+)
+
+# V3 pool liquidity() / slot0(), read for every candidate pool in one Multicall3 round trip
+V3_LIQUIDITY_SELECTOR = bytes.fromhex("1a686502")
+V3_SLOT0_SELECTOR = bytes.fromhex("3850c7bd")
+V3_LIQUIDITY_RESULT_TYPES = ("uint128",)
+V3_SLOT0_RESULT_TYPES = ("uint160", "int24", "uint16", "uint16", "uint16", "uint8", "bool")
+
+
+def _min_amount_out(expected_amount: int, slippage_percent: float) -> int:
+    """Minimum output after slippage, in integer basis points (no float rounding)."""
+    bps = int(round((100 - slippage_percent) * 100))
+    return (expected_amount * bps) // 10000
 
 
 @dataclass
@@ -317,6 +392,20 @@ class DEXQuote:
     dex_type: str
 
 
+class V3PoolState(NamedTuple):
+    """Liquidity/price snapshot of a V3 pool (tuple-backed: no per-instance dict)"""
+    address: str
+    fee: int
+    liquidity: int
+    sqrt_price_x96: int
+    unlocked: bool
+
+    @property
+    def is_tradable(self) -> bool:
+        """Pool must have liquidity, valid price, and be unlocked"""
+        return self.liquidity > 0 and self.sqrt_price_x96 > 0 and self.unlocked
+
+
 class MultiDEXRouter:
     """
     Multi-DEX router that supports multiple DEXs and picks the best one.
@@ -341,7 +430,7 @@ class MultiDEXRouter:
         self.w3 = w3
         self.account = account
         self.token_address = w3.to_checksum_address(token_address)
-        self.weth = w3.to_checksum_address(WETH)
+        self.weth = WETH
 
         # Initialize routers
         self.routers = {}
@@ -359,7 +448,7 @@ class MultiDEXRouter:
 
             self.routers[dex_key] = {
                 "contract": w3.eth.contract(
-                    address=w3.to_checksum_address(dex_info["router"]),
+                    address=dex_info["router"],
                     abi=abi
                 ),
                 "config": dex_info
@@ -369,15 +458,42 @@ class MultiDEXRouter:
         self.token = w3.eth.contract(address=self.token_address, abi=ERC20_ABI)
         self.token_decimals = self.token.functions.decimals().call()
         
+        # WETH contract (V3 buys wrap and approve through it)
+        self.weth_contract = w3.eth.contract(address=self.weth, abi=WETH_ABI)
+        
+        # Static swap paths for this token, built once instead of per swap
+        self._buy_path = [self.weth, self.token_address]
+        self._sell_path = [self.token_address, self.weth]
+        aerodrome_factory = DEX_CONFIG["aerodrome"]["factory"]
+        self._buy_routes = [{"from": self.weth, "to": self.token_address, "stable": False, "factory": aerodrome_factory}]
+        self._sell_routes = [{"from": self.token_address, "to": self.weth, "stable": False, "factory": aerodrome_factory}]
+        # Same routes as (from, to, stable, factory) tuples for hand-encoded calldata
+        self._buy_route_args = [(r["from"], r["to"], r["stable"], r["factory"]) for r in self._buy_routes]
+        self._sell_route_args = [(r["from"], r["to"], r["stable"], r["factory"]) for r in self._sell_routes]
+        
         # Track best DEX and fee
         self.best_dex = None
         self.best_fee = None  # Store fee for V3 swaps
         self.best_pool = None  # Store pool address
+
+        # EIP-1559 fee memo shared by back-to-back swaps
+        self._fee_params: Dict[str, int] = {}
+        self._fee_params_fetched_at = 0.0
+
+        # Next nonce for this account, tracked locally after the first fetch
+        self._nonce: Optional[int] = None
+
+        # (dex, "buy"/"sell") -> buffered gas limit from that shape's first estimate
+        self._gas_cache: Dict[Tuple[str, str], int] = {}
+
+        # (token, spender) -> known allowance; only unlimited approvals are cached
+        self._allowance_cache: Dict[Tuple[str, str], int] = {}
+
         self._find_best_dex()
     
     def _find_best_dex(self):
         """Find which DEX has the best liquidity for the token."""
-        print(f"[dim]Finding best DEX for {self.token_address}...[/dim]")
+        logger.debug("Finding best DEX for %s...", self.token_address)
         
         best_dex = None
         best_liquidity = 0
@@ -387,96 +503,91 @@ class MultiDEXRouter:
             try:
                 # Check if pair exists via factory
                 factory = self.w3.eth.contract(
-                    address=self.w3.to_checksum_address(DEX_CONFIG["aerodrome"]["factory"]),
+                    address=DEX_CONFIG["aerodrome"]["factory"],
                     abi=[{"inputs":[{"internalType":"address","name":"tokenA","type":"address"},{"internalType":"address","name":"tokenB","type":"address"},{"internalType":"bool","name":"stable","type":"bool"}],"name":"getPool","outputs":[{"internalType":"address","name":"pool","type":"address"}],"stateMutability":"view","type":"function"}]
                 )
                 # Try volatile pool first (stable=false)
                 pool_address = factory.functions.getPool(self.weth, self.token_address, False).call()
-                if pool_address and pool_address != "0x0000000000000000000000000000000000000000":
-                    # Check pool has code
-                    code = self.w3.eth.get_code(pool_address)
-                    if len(code) > 0:
-                        best_dex = "aerodrome"
-                        best_liquidity = 1
-                        self.best_pool = pool_address
-                        print(f"[green]✓ Aerodrome pool found (volatile): {pool_address[:20]}...[/green]")
+                # The factory only registers pools it has deployed, so a non-zero
+                # address is already proof of a contract - no eth_getCode needed
+                if pool_address and pool_address != ZERO_ADDRESS:
+                    best_dex = "aerodrome"
+                    best_liquidity = 1
+                    self.best_pool = pool_address
+                    logger.info("Aerodrome pool found (volatile): %s", pool_address)
                 # Try stable pool if volatile not found
                 if not best_dex:
                     pool_address = factory.functions.getPool(self.weth, self.token_address, True).call()
-                    if pool_address and pool_address != "0x0000000000000000000000000000000000000000":
-                        code = self.w3.eth.get_code(pool_address)
-                        if len(code) > 0:
-                            best_dex = "aerodrome"
-                            best_liquidity = 1
-                            self.best_pool = pool_address
-                            print(f"[green]✓ Aerodrome pool found (stable): {pool_address[:20]}...[/green]")
+                    if pool_address and pool_address != ZERO_ADDRESS:
+                        best_dex = "aerodrome"
+                        best_liquidity = 1
+                        self.best_pool = pool_address
+                        logger.info("Aerodrome pool found (stable): %s", pool_address)
             except Exception as e:
-                print(f"[dim]  Aerodrome: {e}[/dim]")
+                logger.debug("Aerodrome: %s", e)
         
         # Try Uniswap V2 if Aerodrome not found
         if not best_dex and "uniswap_v2" in self.routers:
             try:
                 router = self.routers["uniswap_v2"]["contract"]
-                path = [self.weth, self.token_address]
+                path = self._buy_path
                 amounts = router.functions.getAmountsOut(10**15, path).call()
                 if amounts and amounts[-1] > 0:
                     best_dex = "uniswap_v2"
                     best_liquidity = amounts[-1]
-                    print(f"[green]✓ Uniswap V2 has liquidity[/green]")
+                    logger.info("Uniswap V2 has liquidity")
             except Exception as e:
-                print(f"[dim]  Uniswap V2: {e}[/dim]")
+                logger.debug("Uniswap V2: %s", e)
         
         # Try Uniswap V3 last (requires Permit2, problematic on Base)
         if not best_dex and "uniswap_v3" in self.routers:
             try:
-                # Check if V3 pool exists for any fee tier
-                factory = self.w3.eth.contract(
-                    address=self.w3.to_checksum_address(DEX_CONFIG["uniswap_v3"]["factory"]),
-                    abi=[{"inputs":[{"internalType":"address","name":"tokenA","type":"address"},{"internalType":"address","name":"tokenB","type":"address"},{"internalType":"uint24","name":"fee","type":"uint24"}],"name":"getPool","outputs":[{"internalType":"address","name":"pool","type":"address"}],"stateMutability":"view","type":"function"}]
-                )
+                # Check if V3 pool exists for any fee tier - one Multicall3 round trip
+                fee_tiers = DEX_CONFIG["uniswap_v3"]["fee_tiers"]
+                factory_address = DEX_CONFIG["uniswap_v3"]["factory"]
+                pool_results = multicall(self.w3, [
+                    (factory_address, V3_GET_POOL_SELECTOR + V3_GET_POOL_ARGS_ENCODER((self.weth, self.token_address, fee)))
+                    for fee in fee_tiers
+                ])
                 
-                for fee in DEX_CONFIG["uniswap_v3"]["fee_tiers"]:
-                    try:
-                        pool_address = factory.functions.getPool(self.weth, self.token_address, fee).call()
-                        if pool_address and pool_address != "0x0000000000000000000000000000000000000000":
-                            # Pool exists - check if it has liquidity and is initialized
-                            pool = self.w3.eth.contract(address=pool_address, abi=UNISWAP_V3_POOL_ABI)
-                            liquidity = pool.functions.liquidity().call()
-                            slot0 = pool.functions.slot0().call()
-                            sqrt_price = slot0[0]
-                            unlocked = slot0[6]
-                            
-                            print(f"[dim]  V3 fee={fee}: pool={pool_address[:20]}..., liq={liquidity}, sqrtPrice={sqrt_price}, unlocked={unlocked}[/dim]")
-                            
-                            # Pool must have liquidity, valid price, and be unlocked
-                            if liquidity > 0 and sqrt_price > 0 and unlocked:
-                                # Found a valid pool - prefer lower fee tiers for better execution
-                                # Use a scoring system: higher liquidity / lower fee = better
-                                score = liquidity / (fee + 1)  # +1 to avoid div by zero
-                                if score > best_liquidity:
-                                    best_dex = "uniswap_v3"
-                                    best_liquidity = score
-                                    self.best_fee = fee
-                                    self.best_pool = pool_address
-                                    print(f"[green]✓ Uniswap V3 pool selected (fee={fee}, liq={liquidity})[/green]")
-                    except Exception as e:
-                        print(f"[dim]  V3 fee={fee}: {e}[/dim]")
+                pools = []
+                for fee, pool_data in zip(fee_tiers, pool_results):
+                    # eth_abi returns lowercase addresses; checksum before building contracts
+                    pool_address = decode(ADDRESS_RESULT_TYPES, pool_data)[0] if pool_data else None
+                    if pool_address and pool_address != ZERO_ADDRESS:
+                        pools.append((Web3.to_checksum_address(pool_address), fee))
+                
+                # Pools exist - check they have liquidity and are initialized (one round trip)
+                for state in self._get_v3_pool_states(pools):
+                    if state is None:
                         continue
+                    logger.debug("V3 fee=%s: %s", state.fee, state)
+                    
+                    if state.is_tradable:
+                        # Found a valid pool - prefer lower fee tiers for better execution
+                        # Use a scoring system: higher liquidity / lower fee = better
+                        score = state.liquidity / (state.fee + 1)  # +1 to avoid div by zero
+                        if score > best_liquidity:
+                            best_dex = "uniswap_v3"
+                            best_liquidity = score
+                            self.best_fee = state.fee
+                            self.best_pool = state.address
+                            logger.info("Uniswap V3 pool selected (fee=%s, liq=%s)", state.fee, state.liquidity)
             except Exception as e:
-                print(f"[dim]  Uniswap V3: {e}[/dim]")
+                logger.debug("Uniswap V3: %s", e)
 
         # Try Uniswap V4 (checksum fix applied)
         if not best_dex and "uniswap_v4" in self.routers:
             try:
-                # Check if router has code (using checksummed address)
-                router_addr = self.w3.to_checksum_address(self.routers["uniswap_v4"]["config"]["router"])
+                # Check if router has code
+                router_addr = self.routers["uniswap_v4"]["config"]["router"]
                 code = self.w3.eth.get_code(router_addr)
                 if len(code) > 0:
                     best_dex = "uniswap_v4"
                     best_liquidity = 1  # Mark as found
-                    print(f"[green]✓ Uniswap V4 router found[/green]")
+                    logger.info("Uniswap V4 router found")
             except Exception as e:
-                print(f"[dim]  Uniswap V4: {e}[/dim]")
+                logger.debug("Uniswap V4: %s", e)
 
         # Note: Aerodrome removed due to interface mismatch
         # To re-add: implement correct Solidly router ABI
@@ -485,22 +596,207 @@ class MultiDEXRouter:
         if not best_dex and "baseswap" in self.routers:
             try:
                 router = self.routers["baseswap"]["contract"]
-                path = [self.weth, self.token_address]
+                path = self._buy_path
                 amounts = router.functions.getAmountsOut(10**15, path).call()
                 if amounts and amounts[-1] > 0:
                     best_dex = "baseswap"
                     best_liquidity = amounts[-1]
-                    print(f"[green]✓ BaseSwap has liquidity[/green]")
+                    logger.info("BaseSwap has liquidity")
             except Exception as e:
-                print(f"[dim]  BaseSwap: {e}[/dim]")
+                logger.debug("BaseSwap: %s", e)
         
         self.best_dex = best_dex
         if best_dex:
             dex_name = DEX_CONFIG[best_dex]["name"]
-            print(f"[bold green]Using {dex_name} for trading[/bold green]")
+            logger.info("Using %s for trading", dex_name)
         else:
-            print(f"[red]✗ No DEX found with liquidity for this token![/red]")
+            logger.error("No DEX found with liquidity for this token!")
     
+    def _get_v3_pool_states(self, pools: List[Tuple[str, int]]) -> List[Optional[V3PoolState]]:
+        """
+        Read liquidity and slot0 for several V3 pools in one Multicall3 round trip.
+        
+        Args:
+            pools: (pool address, fee tier) pairs
+        
+        Returns:
+            State for each pool, or None where either read reverted
+        """
+        if not pools:
+            return []
+        calls = []
+        for pool_address, _ in pools:
+            calls.append((pool_address, V3_LIQUIDITY_SELECTOR))
+            calls.append((pool_address, V3_SLOT0_SELECTOR))
+        results = multicall(self.w3, calls)
+        
+        states = []
+        for i, (pool_address, fee) in enumerate(pools):
+            liquidity_data, slot0_data = results[2 * i], results[2 * i + 1]
+            if not liquidity_data or not slot0_data:
+                logger.debug("V3 fee=%s: pool state read reverted", fee)
+                states.append(None)
+                continue
+            liquidity = decode(V3_LIQUIDITY_RESULT_TYPES, liquidity_data)[0]
+            slot0 = decode(V3_SLOT0_RESULT_TYPES, slot0_data)
+            states.append(V3PoolState(pool_address, fee, liquidity, slot0[0], slot0[6]))
+        return states
+
+    def _ensure_token_approval(self, spender: str, amount: int, fees: Dict[str, int], nonce: int,
+                               token=None) -> int:
+        """
+        Make sure `spender` may pull `amount` of `token`, approving MAX once if not.
+        
+        Args:
+            token: ERC20 contract to approve (defaults to the traded token)
+        
+        Returns:
+            Nonce to use for the next transaction
+        
+        Raises:
+            RuntimeError: If the approve transaction reverts
+        """
+        token = token or self.token
+        key = (token.address, spender)
+        allowance = self._allowance_cache.get(key)
+        if allowance is None:
+            allowance = token.functions.allowance(self.account.address, spender).call()
+            if allowance >= MAX_UINT256 // 2:
+                self._allowance_cache[key] = allowance
+        if allowance >= amount:
+            return nonce
+        
+        approve_data = APPROVE_SELECTOR + APPROVE_ARGS_ENCODER((spender, MAX_UINT256))
+        approve_tx = self._build_call_tx(token.address, approve_data, fees, nonce)
+        approve_hash = self._send_tx(approve_tx)
+        receipt = self._wait_for_receipt(approve_hash)
+        if receipt['status'] != 1:
+            raise RuntimeError(f"Approval failed (status={receipt['status']}) - TX: {self.w3.to_hex(approve_hash)}")
+        self._allowance_cache[key] = MAX_UINT256
+        return nonce + 1
+
+    def _on_swap_revert(self, label: str, receipt: Dict, tx_hex: str,
+                        token=None, spender: Optional[str] = None) -> Tuple[bool, str]:
+        """
+        Forget state a reverted swap may have invalidated and build its error result.
+        
+        The cached gas estimates are dropped, and so is the cached allowance of `token`
+        for `spender` (it may be stale - revoked or spent elsewhere).
+        """
+        self._gas_cache.clear()
+        if token is not None:
+            self._allowance_cache.pop((token.address, spender), None)
+        return False, f"{label} failed (status={receipt['status']}) - TX: {tx_hex}"
+
+    def _build_call_tx(self, to: str, data: bytes, fees: Dict[str, int], nonce: int,
+                       gas: int = 100000, value: int = 0) -> Dict:
+        """Build a signed-ready tx dict for precomputed calldata."""
+        return {
+            'to': to,
+            'data': data,
+            'value': value,
+            'gas': gas,
+            **fees,
+            'nonce': nonce,
+            'chainId': 8453
+        }
+
+    def _apply_cached_gas(self, tx: Dict, direction: str):
+        """
+        Replace the default swap gas limit with an estimate cached per swap shape.
+        
+        The first swap of a shape pays one eth_estimateGas; later ones reuse it. If
+        estimation fails, the tx keeps its default limit. Reverted swaps clear the
+        cache, in case a cached limit ran short.
+        """
+        shape = (self.best_dex, direction)
+        gas = self._gas_cache.get(shape)
+        if gas is None:
+            try:
+                # Simulate from our account - from the zero address every transferFrom reverts
+                params = {k: v for k, v in tx.items() if k != 'gas'}
+                params['from'] = self.account.address
+                estimate = self.w3.eth.estimate_gas(params)
+            except Exception as e:
+                logger.debug("Gas estimate failed for %s: %s", shape, e)
+                return
+            gas = int(estimate * GAS_ESTIMATE_BUFFER)
+            self._gas_cache[shape] = gas
+        tx['gas'] = gas
+
+    def _wait_for_receipt(self, tx_hash, timeout: float = RECEIPT_TIMEOUT_SECONDS):
+        """
+        Poll for a transaction receipt with backoff.
+        
+        web3's wait_for_transaction_receipt polls every 0.1s; this starts at
+        0.25s and backs off to 2s, cutting receipt RPCs several-fold per swap.
+        
+        Raises:
+            TimeExhausted: if the tx isn't mined within `timeout` seconds
+        """
+        deadline = time.monotonic() + timeout
+        delay = RECEIPT_POLL_INITIAL_SECONDS
+        while True:
+            try:
+                return self.w3.eth.get_transaction_receipt(tx_hash)
+            except TransactionNotFound:
+                pass
+            if time.monotonic() >= deadline:
+                raise TimeExhausted(f"Transaction {self.w3.to_hex(tx_hash)} not mined after {timeout}s")
+            time.sleep(delay)
+            delay = min(delay * 1.5, RECEIPT_POLL_MAX_SECONDS)
+
+    def _get_nonce(self) -> int:
+        """Next nonce to use - fetched from the node only when not tracked locally."""
+        if self._nonce is None:
+            self._nonce = self.w3.eth.get_transaction_count(self.account.address, 'pending')
+        return self._nonce
+
+    def _send_tx(self, tx: Dict):
+        """Sign and broadcast a transaction, advancing the local nonce past it."""
+        signed = self.account.sign_transaction(tx)
+        tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
+        self._nonce = tx['nonce'] + 1
+        return tx_hash
+
+    def _get_fee_params(self) -> Dict[str, int]:
+        """Get EIP-1559 fee fields, reusing the last values for a couple of seconds."""
+        if self._fee_params_stale():
+            self._set_fee_params(self.w3.eth.get_block('pending')['baseFeePerGas'])
+        return self._fee_params
+
+    def _fee_params_stale(self) -> bool:
+        """Whether the memoized fee params are older than the TTL."""
+        return time.monotonic() - self._fee_params_fetched_at > FEE_PARAMS_TTL_SECONDS
+
+    def _set_fee_params(self, base_fee: int):
+        """Derive and memoize EIP-1559 fee fields from a block's base fee."""
+        self._fee_params = {
+            'maxFeePerGas': base_fee * 2 + PRIORITY_FEE_WEI,
+            'maxPriorityFeePerGas': PRIORITY_FEE_WEI,
+        }
+        self._fee_params_fetched_at = time.monotonic()
+
+    def _get_swap_context(self) -> Tuple[Dict[str, int], int]:
+        """
+        Fee params and starting nonce for a swap.
+        
+        When neither is cached, both reads go out as one JSON-RPC batch
+        instead of two sequential round trips.
+        """
+        if self._nonce is None and self._fee_params_stale():
+            try:
+                with self.w3.batch_requests() as batch:
+                    batch.add(self.w3.eth.get_block('pending'))
+                    batch.add(self.w3.eth.get_transaction_count(self.account.address, 'pending'))
+                    block, nonce = batch.execute()
+                self._set_fee_params(block['baseFeePerGas'])
+                self._nonce = nonce
+            except Exception as e:
+                # Provider without batch support - fall back to individual calls
+                logger.debug("Batched swap prefetch failed: %s", e)
+        return self._get_fee_params(), self._get_nonce()
+
     def get_best_dex(self) -> Optional[str]:
         """Get the best DEX key."""
         return self.best_dex
@@ -520,94 +816,76 @@ class MultiDEXRouter:
             return False, "No DEX with liquidity found"
         
         try:
-            amount_in_wei = int(amount_eth * 10**18)
+            amount_in_wei = int(amount_eth.scaleb(18))
             router_info = self.routers[self.best_dex]
+            # Fetch fee params and starting nonce once; sequential txs bump the nonce locally
+            fees, nonce = self._get_swap_context()
             router = router_info["contract"]
             dex_config = router_info["config"]
             
             if dex_config["type"] == "solidly":
                 # Aerodrome/Solidly style swap
                 # Uses routes with stable boolean and different function signature
-                routes = [{"from": self.weth, "to": self.token_address, "stable": False, "factory": dex_config["factory"]}]
+                routes = self._buy_routes
                 
                 # Get expected output
                 amounts_out = router.functions.getAmountsOut(amount_in_wei, routes).call()
                 expected_out = amounts_out[-1]
-                min_out = int(expected_out * (100 - slippage_percent) / 100)
+                min_out = _min_amount_out(expected_out, slippage_percent)
                 
                 # Build transaction
-                deadline = int(self.w3.eth.get_block('latest')['timestamp']) + 300
-                tx = router.functions.swapExactETHForTokens(
-                    min_out,
-                    routes,
-                    self.account.address,
-                    deadline
-                ).build_transaction({
-                    'from': self.account.address,
-                    'value': amount_in_wei,
-                    'gas': 300000,
-                    'gasPrice': self.w3.eth.gas_price,
-                    'nonce': self.w3.eth.get_transaction_count(self.account.address),
-                    'chainId': 8453
-                })
-                
-                # Sign and send
-                signed = self.account.sign_transaction(tx)
-                tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
+                deadline = int(time.time()) + 300
+                swap_data = AERODROME_SWAP_EXACT_ETH_FOR_TOKENS_SELECTOR + AERODROME_SWAP_EXACT_ETH_FOR_TOKENS_ARGS_ENCODER(
+                    (min_out, self._buy_route_args, self.account.address, deadline)
+                )
+                tx = self._build_call_tx(dex_config["router"], swap_data, fees, nonce, gas=300000, value=amount_in_wei)
+                self._apply_cached_gas(tx, "buy")
+                
+                tx_hash = self._send_tx(tx)
                 
                 # Wait for receipt
-                receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+                receipt = self._wait_for_receipt(tx_hash)
                 tx_hex = self.w3.to_hex(tx_hash)
 
                 if receipt['status'] == 1:
                     return True, tx_hex
                 else:
-                    return False, f"Aerodrome swap failed (status={receipt['status']}) - TX: {tx_hex}"
+                    return self._on_swap_revert("Aerodrome swap", receipt, tx_hex)
                 
             elif dex_config["type"] == "uniswap_v2":
                 # V2-style swap
-                path = [self.weth, self.token_address]
+                path = self._buy_path
                 
                 # Get expected output
                 amounts_out = router.functions.getAmountsOut(amount_in_wei, path).call()
                 expected_out = amounts_out[-1]
-                min_out = int(expected_out * (100 - slippage_percent) / 100)
+                min_out = _min_amount_out(expected_out, slippage_percent)
                 
                 # Build transaction
-                deadline = int(self.w3.eth.get_block('latest')['timestamp']) + 300
-                tx = router.functions.swapExactETHForTokens(
-                    min_out,
-                    path,
-                    self.account.address,
-                    deadline
-                ).build_transaction({
-                    'from': self.account.address,
-                    'value': amount_in_wei,
-                    'gas': 300000,
-                    'gasPrice': self.w3.eth.gas_price,
-                    'nonce': self.w3.eth.get_transaction_count(self.account.address),
-                    'chainId': 8453
-                })
-                
-                # Sign and send
-                signed = self.account.sign_transaction(tx)
-                tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
+                deadline = int(time.time()) + 300
+                swap_data = V2_SWAP_EXACT_ETH_FOR_TOKENS_SELECTOR + V2_SWAP_EXACT_ETH_FOR_TOKENS_ARGS_ENCODER(
+                    (min_out, path, self.account.address, deadline)
+                )
+                tx = self._build_call_tx(dex_config["router"], swap_data, fees, nonce, gas=300000, value=amount_in_wei)
+                self._apply_cached_gas(tx, "buy")
+                
+                tx_hash = self._send_tx(tx)
                 
                 # Wait for receipt
-                receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+                receipt = self._wait_for_receipt(tx_hash)
                 tx_hex = self.w3.to_hex(tx_hash)
 
                 if receipt['status'] == 1:
                     return True, tx_hex
                 else:
-                    return False, f"V2 swap failed (status={receipt['status']}) - TX: {tx_hex}"
+                    return self._on_swap_revert("V2 swap", receipt, tx_hex)
 
             elif dex_config["type"] == "uniswap_v3":
                 # V3 swap - use the fee and pool found during discovery
                 if not self.best_fee or not self.best_pool:
                     return False, "V3 fee/pool not set - discovery failed"
                 
-                print(f"[dim]Using V3 pool: {self.best_pool[:20]}... with fee={self.best_fee}[/dim]")
+                logger.debug("Using V3 pool: %s with fee=%s", self.best_pool, self.best_fee)
                 
                 # For V3 ETH->Token, we need to:
                 # 1. Wrap ETH to WETH via WETH contract (skip if already have WETH)
@@ -617,57 +895,28 @@ class MultiDEXRouter:
                 # SwapRouter02's exactInputSingle pulls tokens via pay() which requires
                 # approval from the user's wallet, not from router's internal balance.
                 
-                deadline = int(self.w3.eth.get_block('latest')['timestamp']) + 300
+                deadline = int(time.time()) + 300
                 min_out = 0  # Would use proper quoting in production
                 
-                # Initialize WETH contract
-                weth_contract = self.w3.eth.contract(address=self.weth, abi=WETH_ABI)
-                
-                # Get starting nonce and track it manually for sequential txs
-                nonce = self.w3.eth.get_transaction_count(self.account.address)
+                weth_contract = self.weth_contract
                 
                 # Check existing WETH balance - skip wrapping if we already have enough
                 weth_balance = weth_contract.functions.balanceOf(self.account.address).call()
                 if weth_balance >= amount_in_wei:
-                    print(f"[dim]  Already have {weth_balance / 1e18:.6f} WETH, skipping wrap[/dim]")
+                    logger.debug("Already have %s WETH wei, skipping wrap", weth_balance)
                 else:
                     # Step 1: Wrap ETH to WETH
-                    wrap_tx = weth_contract.functions.deposit().build_transaction({
-                        'from': self.account.address,
-                        'value': amount_in_wei,
-                        'gas': 100000,
-                        'gasPrice': self.w3.eth.gas_price,
-                        'nonce': nonce,
-                        'chainId': 8453
-                    })
-                    signed_wrap = self.account.sign_transaction(wrap_tx)
-                    wrap_hash = self.w3.eth.send_raw_transaction(signed_wrap.raw_transaction)
-                    self.w3.eth.wait_for_transaction_receipt(wrap_hash, timeout=120)
-                    print(f"[dim]  Wrapped ETH -> WETH (tx: {wrap_hash.hex()[:20]}...)[/dim]")
+                    wrap_tx = self._build_call_tx(self.weth, DEPOSIT_SELECTOR, fees, nonce, value=amount_in_wei)
+                    wrap_hash = self._send_tx(wrap_tx)
+                    self._wait_for_receipt(wrap_hash)
+                    logger.debug("Wrapped ETH -> WETH (tx: %s)", wrap_hash.hex())
                     nonce += 1  # Increment nonce for next tx
                 
-                # Step 2: Approve SwapRouter02 to spend WETH
-                # Check existing allowance first
-                router_address = dex_config["router"]
-                existing_allowance = weth_contract.functions.allowance(self.account.address, router_address).call()
-                if existing_allowance >= amount_in_wei:
-                    print(f"[dim]  Already approved {existing_allowance / 1e18:.6f} WETH, skipping approve[/dim]")
-                else:
-                    approve_tx = weth_contract.functions.approve(
-                        router_address,
-                        amount_in_wei
-                    ).build_transaction({
-                        'from': self.account.address,
-                        'gas': 100000,
-                        'gasPrice': self.w3.eth.gas_price,
-                        'nonce': nonce,
-                        'chainId': 8453
-                    })
-                    signed_approve = self.account.sign_transaction(approve_tx)
-                    approve_hash = self.w3.eth.send_raw_transaction(signed_approve.raw_transaction)
-                    self.w3.eth.wait_for_transaction_receipt(approve_hash, timeout=120)
-                    print(f"[dim]  Approved router to spend WETH (tx: {approve_hash.hex()[:20]}...)[/dim]")
-                    nonce += 1  # Increment nonce for next tx
+                # Step 2: Approve SwapRouter02 to spend WETH (once - the MAX allowance
+                # is cached, so later buys skip the allowance probe entirely)
+                nonce = self._ensure_token_approval(
+                    dex_config["router"], amount_in_wei, fees, nonce, token=weth_contract
+                )
                 
                 # Step 3: Swap WETH for token
                 swap_params = (
@@ -680,31 +929,30 @@ class MultiDEXRouter:
                     min_out,
                     0  # sqrtPriceLimitX96
                 )
-                swap_tx = router.functions.exactInputSingle(swap_params).build_transaction({
-                    'from': self.account.address,
-                    'gas': 300000,
-                    'gasPrice': self.w3.eth.gas_price,
-                    'nonce': nonce,  # Use tracked nonce
-                    'chainId': 8453
-                })
+                swap_data = EXACT_INPUT_SINGLE_SELECTOR + EXACT_INPUT_SINGLE_ARGS_ENCODER((swap_params,))
+                swap_tx = self._build_call_tx(dex_config["router"], swap_data, fees, nonce, gas=300000)
+                self._apply_cached_gas(swap_tx, "buy")
                 
-                signed = self.account.sign_transaction(swap_tx)
-                tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
+                tx_hash = self._send_tx(swap_tx)
                 
                 # Wait for receipt
-                receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+                receipt = self._wait_for_receipt(tx_hash)
                 tx_hex = self.w3.to_hex(tx_hash)
 
                 if receipt['status'] == 1:
                     return True, tx_hex
                 else:
-                    return False, f"V3 ETH->Token failed (status={receipt['status']}) - TX: {tx_hex}"
+                    return self._on_swap_revert(
+                        "V3 ETH->Token", receipt, tx_hex, weth_contract, dex_config["router"]
+                    )
 
             elif dex_config["type"] == "uniswap_v4":
                 # V4 swap - uses Universal Router with encoded commands
                 return False, "Uniswap V4 not implemented"
 
         except Exception as e:
+            # Nonce may be out of sync (e.g. a tx sent elsewhere) - refetch next time
+            self._nonce = None
             return False, f"Swap error: {e}"
 
     def swap_tokens_for_eth(self, amount_tokens: Decimal, slippage_percent: float = 2.0) -> Tuple[bool, str]:
@@ -722,150 +970,91 @@ class MultiDEXRouter:
             return False, "No DEX with liquidity found"
         
         try:
-            amount_in_units = int(amount_tokens * (10 ** self.token_decimals))
+            amount_in_units = int(amount_tokens.scaleb(self.token_decimals))
             router_info = self.routers[self.best_dex]
+            # Approval (if still needed) advances the nonce used by the swap
+            fees, nonce = self._get_swap_context()
             router = router_info["contract"]
             dex_config = router_info["config"]
             
             if dex_config["type"] == "solidly":
                 # Aerodrome/Solidly style swap
-                routes = [{"from": self.token_address, "to": self.weth, "stable": False, "factory": dex_config["factory"]}]
-                
-                # Approve router first
-                approve_tx = self.token.functions.approve(
-                    dex_config["router"],
-                    amount_in_units
-                ).build_transaction({
-                    'from': self.account.address,
-                    'gas': 100000,
-                    'gasPrice': self.w3.eth.gas_price,
-                    'nonce': self.w3.eth.get_transaction_count(self.account.address),
-                    'chainId': 8453
-                })
-                
-                signed_approve = self.account.sign_transaction(approve_tx)
-                approve_hash = self.w3.eth.send_raw_transaction(signed_approve.raw_transaction)
-                self.w3.eth.wait_for_transaction_receipt(approve_hash, timeout=120)
+                routes = self._sell_routes
+                
+                # Approve router (once - later sells reuse the allowance)
+                nonce = self._ensure_token_approval(dex_config["router"], amount_in_units, fees, nonce)
                 
                 # Get expected output
                 amounts_out = router.functions.getAmountsOut(amount_in_units, routes).call()
                 expected_out = amounts_out[-1]
-                min_out = int(expected_out * (100 - slippage_percent) / 100)
+                min_out = _min_amount_out(expected_out, slippage_percent)
                 
                 # Build swap transaction
-                deadline = int(self.w3.eth.get_block('latest')['timestamp']) + 300
-                tx = router.functions.swapExactTokensForETH(
-                    amount_in_units,
-                    min_out,
-                    routes,
-                    self.account.address,
-                    deadline
-                ).build_transaction({
-                    'from': self.account.address,
-                    'gas': 300000,
-                    'gasPrice': self.w3.eth.gas_price,
-                    'nonce': self.w3.eth.get_transaction_count(self.account.address),
-                    'chainId': 8453
-                })
-                
-                # Sign and send
-                signed = self.account.sign_transaction(tx)
-                tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
+                deadline = int(time.time()) + 300
+                swap_data = AERODROME_SWAP_EXACT_TOKENS_FOR_ETH_SELECTOR + AERODROME_SWAP_EXACT_TOKENS_FOR_ETH_ARGS_ENCODER(
+                    (amount_in_units, min_out, self._sell_route_args, self.account.address, deadline)
+                )
+                tx = self._build_call_tx(dex_config["router"], swap_data, fees, nonce, gas=300000)
+                self._apply_cached_gas(tx, "sell")
+                
+                tx_hash = self._send_tx(tx)
 
                 # Wait for receipt
-                receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+                receipt = self._wait_for_receipt(tx_hash)
                 tx_hex = self.w3.to_hex(tx_hash)
 
                 if receipt['status'] == 1:
                     return True, tx_hex
                 else:
-                    return False, f"Aerodrome Token->ETH failed (status={receipt['status']}) - TX: {tx_hex}"
+                    return self._on_swap_revert(
+                        "Aerodrome Token->ETH", receipt, tx_hex, self.token, dex_config["router"]
+                    )
                 
             elif dex_config["type"] == "uniswap_v2":
                 # V2-style swap
-                path = [self.token_address, self.weth]
-                
-                # Approve router first
-                approve_tx = self.token.functions.approve(
-                    dex_config["router"],
-                    amount_in_units
-                ).build_transaction({
-                    'from': self.account.address,
-                    'gas': 100000,
-                    'gasPrice': self.w3.eth.gas_price,
-                    'nonce': self.w3.eth.get_transaction_count(self.account.address),
-                    'chainId': 8453
-                })
-                
-                signed_approve = self.account.sign_transaction(approve_tx)
-                approve_hash = self.w3.eth.send_raw_transaction(signed_approve.raw_transaction)
-                self.w3.eth.wait_for_transaction_receipt(approve_hash, timeout=120)
+                path = self._sell_path
+                
+                # Approve router (once - later sells reuse the allowance)
+                nonce = self._ensure_token_approval(dex_config["router"], amount_in_units, fees, nonce)
                 
                 # Get expected output
                 amounts_out = router.functions.getAmountsOut(amount_in_units, path).call()
                 expected_out = amounts_out[-1]
-                min_out = int(expected_out * (100 - slippage_percent) / 100)
+                min_out = _min_amount_out(expected_out, slippage_percent)
                 
                 # Build swap transaction
-                deadline = int(self.w3.eth.get_block('latest')['timestamp']) + 300
-                tx = router.functions.swapExactTokensForETH(
-                    amount_in_units,
-                    min_out,
-                    path,
-                    self.account.address,
-                    deadline
-                ).build_transaction({
-                    'from': self.account.address,
-                    'gas': 300000,
-                    'gasPrice': self.w3.eth.gas_price,
-                    'nonce': self.w3.eth.get_transaction_count(self.account.address),
-                    'chainId': 8453
-                })
-                
-                # Sign and send
-                signed = self.account.sign_transaction(tx)
-                tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
+                deadline = int(time.time()) + 300
+                swap_data = V2_SWAP_EXACT_TOKENS_FOR_ETH_SELECTOR + V2_SWAP_EXACT_TOKENS_FOR_ETH_ARGS_ENCODER(
+                    (amount_in_units, min_out, path, self.account.address, deadline)
+                )
+                tx = self._build_call_tx(dex_config["router"], swap_data, fees, nonce, gas=300000)
+                self._apply_cached_gas(tx, "sell")
+                
+                tx_hash = self._send_tx(tx)
 
                 # Wait for receipt
-                receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+                receipt = self._wait_for_receipt(tx_hash)
                 tx_hex = self.w3.to_hex(tx_hash)
 
                 if receipt['status'] == 1:
                     return True, tx_hex
                 else:
-                    return False, f"V2 Token->ETH failed (status={receipt['status']}) - TX: {tx_hex}"
+                    return self._on_swap_revert(
+                        "V2 Token->ETH", receipt, tx_hex, self.token, dex_config["router"]
+                    )
 
             elif dex_config["type"] == "uniswap_v3":
-                # V3 token->ETH swap
-                factory = self.w3.eth.contract(
-                    address=self.w3.to_checksum_address(DEX_CONFIG["uniswap_v3"]["factory"]),
-                    abi=UNISWAP_V3_FACTORY_ABI
-                )
-                
-                # Use the fee and pool found during discovery
+                # V3 token->ETH swap - use the fee and pool found during discovery
                 if not self.best_fee or not self.best_pool:
                     return False, "V3 fee/pool not set - discovery failed"
                 
-                print(f"[dim]Using V3 pool for sell: {self.best_pool[:20]}... with fee={self.best_fee}[/dim]")
-                
-                # Approve router
-                approve_tx = self.token.functions.approve(
-                    dex_config["router"],
-                    amount_in_units
-                ).build_transaction({
-                    'from': self.account.address,
-                    'gas': 100000,
-                    'gasPrice': self.w3.eth.gas_price,
-                    'nonce': self.w3.eth.get_transaction_count(self.account.address),
-                    'chainId': 8453
-                })
-                
-                signed_approve = self.account.sign_transaction(approve_tx)
-                approve_hash = self.w3.eth.send_raw_transaction(signed_approve.raw_transaction)
-                self.w3.eth.wait_for_transaction_receipt(approve_hash, timeout=120)
-                
-                deadline = int(self.w3.eth.get_block('latest')['timestamp']) + 300
-                # web3.py v7 requires tuple for struct params
+                logger.debug("Using V3 pool for sell: %s with fee=%s", self.best_pool, self.best_fee)
+                
+                # Approve router (once - later sells reuse the allowance)
+                nonce = self._ensure_token_approval(dex_config["router"], amount_in_units, fees, nonce)
+                
+                deadline = int(time.time()) + 300
+                # Struct params as a tuple, in ABI field order
                 swap_params = (
                     self.token_address,
                     self.weth,
@@ -876,26 +1065,25 @@ class MultiDEXRouter:
                     0,  # amountOutMinimum
                     0   # sqrtPriceLimitX96
                 )
-                tx = router.functions.exactInputSingle(swap_params).build_transaction({
-                    'from': self.account.address,
-                    'gas': 300000,
-                    'gasPrice': self.w3.eth.gas_price,
-                    'nonce': self.w3.eth.get_transaction_count(self.account.address),
-                    'chainId': 8453
-                })
-                
-                signed = self.account.sign_transaction(tx)
-                tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
-                receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+                swap_data = EXACT_INPUT_SINGLE_SELECTOR + EXACT_INPUT_SINGLE_ARGS_ENCODER((swap_params,))
+                tx = self._build_call_tx(dex_config["router"], swap_data, fees, nonce, gas=300000)
+                self._apply_cached_gas(tx, "sell")
+                
+                tx_hash = self._send_tx(tx)
+                receipt = self._wait_for_receipt(tx_hash)
                 tx_hex = self.w3.to_hex(tx_hash)
 
                 if receipt['status'] == 1:
                     return True, tx_hex
                 else:
-                    return False, f"V3 Token->ETH failed (status={receipt['status']}) - TX: {tx_hex}"
+                    return self._on_swap_revert(
+                        "V3 Token->ETH", receipt, tx_hex, self.token, dex_config["router"]
+                    )
 
             elif dex_config["type"] == "uniswap_v4":
                 return False, "Uniswap V4 not implemented"
 
         except Exception as e:
+            # Nonce may be out of sync (e.g. a tx sent elsewhere) - refetch next time
+            self._nonce = None
             return False, f"Swap error: {e}"
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Multicall3 Batching
+===================
+Runs several read-only contract calls in a single eth_call through
+Multicall3, so N view lookups cost one RPC round trip instead of N.
+
+Multicall3 on Base: 0xcA11bde05977b3631167028862bE2a173976CA11
+"""
+
+from typing import List, Optional, Sequence, Tuple
+from eth_abi import decode
+from eth_abi.registry import registry as abi_registry
+from web3 import Web3
+
+from calldata import DECIMALS_RESULT_TYPES, DECIMALS_SELECTOR, SYMBOL_RESULT_TYPES, SYMBOL_SELECTOR
+
+# Multicall3 address (same on Base and most EVM chains)
+MULTICALL3_ADDRESS = Web3.to_checksum_address("0xcA11bde05977b3631167028862bE2a173976CA11")
+
+# aggregate3((address target, bool allowFailure, bytes callData)[])
+AGGREGATE3_SELECTOR = bytes.fromhex("82ad56cb")
+AGGREGATE3_ARGS_ENCODER = abi_registry.get_encoder("((address,bool,bytes)[])")
+AGGREGATE3_RESULT_TYPES = ("(bool,bytes)[]",)
+
+
+def multicall(w3: Web3, calls: Sequence[Tuple[str, bytes]]) -> List[Optional[bytes]]:
+    """
+    Execute read-only calls in one eth_call via Multicall3.aggregate3.
+
+    Args:
+        w3: Web3 instance
+        calls: (target address, calldata) pairs
+
+    Returns:
+        Raw return data for each call, or None where that call reverted
+    """
+    payload = AGGREGATE3_SELECTOR + AGGREGATE3_ARGS_ENCODER(
+        ([(target, True, data) for target, data in calls],)
+    )
+    raw = w3.eth.call({'to': MULTICALL3_ADDRESS, 'data': payload})
+    (results,) = decode(AGGREGATE3_RESULT_TYPES, raw)
+    return [data if success else None for success, data in results]
+
+
+def get_erc20_metadata(w3: Web3, token_address: str) -> Tuple[Optional[str], Optional[int]]:
+    """
+    Fetch an ERC20's symbol and decimals in a single RPC round trip.
+
+    Returns:
+        (symbol, decimals) - either is None if the token doesn't expose it
+    """
+    symbol_data, decimals_data = multicall(w3, [
+        (token_address, SYMBOL_SELECTOR),
+        (token_address, DECIMALS_SELECTOR),
+    ])
+
+    symbol = None
+    if symbol_data:
+        try:
+            symbol = decode(SYMBOL_RESULT_TYPES, symbol_data)[0]
+        except Exception:
+            # Some older tokens return bytes32 instead of string
+            symbol = symbol_data[:32].rstrip(b"\x00").decode("utf-8", "ignore") or None
+
+    decimals = decode(DECIMALS_RESULT_TYPES, decimals_data)[0] if decimals_data else None
+    return symbol, decimals
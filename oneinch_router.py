@@ -16,14 +16,23 @@ Benefits:
 - API: https://api.1inch.dev/swap/v5.2/8453/
 """
 
-import requests
+import logging
 from typing import Optional, Tuple, Dict, Any
 from decimal import Decimal
 from web3 import Web3
 from eth_account import Account
 
-# 1inch Router on Base
-ONEINCH_ROUTER = "0x1111111254eeb25477b68fb85ed929f73a960582"
+from router_utils import AggregatorMixin, http_session, to_checksum
+
+# Child of the "compute_bot" logger that utils.setup_logging configures, so the swarm
+# path prints these lines and writes them to its log file; otherwise they propagate to root
+logger = logging.getLogger(f"compute_bot.{__name__}")
+
+# 1inch Router on Base (checksummed once at import)
+ONEINCH_ROUTER = Web3.to_checksum_address("0x1111111254eeb25477b68fb85ed929f73a960582")
+
+# WETH on Base
+WETH = Web3.to_checksum_address("0x4200000000000000000000000000000000000006")
 
 # 1inch Router ABI (simplified - key functions)
 ONEINCH_ROUTER_ABI = [
@@ -80,13 +89,15 @@ ERC20_ABI = [
 ]
 
 
-class OneInchAggregator:
+class OneInchAggregator(AggregatorMixin):
     """
     1inch aggregator for best swap routing on Base.
     
     Uses 1inch API to get optimal swap data and executes via router contract.
     """
     
+    token_abi = ERC20_ABI
+    
     def __init__(self, w3: Web3, account: Account, api_key: Optional[str] = None):
         """
         Initialize 1inch aggregator.
@@ -103,11 +114,13 @@ class OneInchAggregator:
         
         # Initialize router contract
         self.router = w3.eth.contract(
-            address=w3.to_checksum_address(ONEINCH_ROUTER),
+            address=ONEINCH_ROUTER,
             abi=ONEINCH_ROUTER_ABI
         )
         
         self.api_base = f"https://api.1inch.dev/swap/v5.2/{self.chain_id}"
+        
+        self._init_aggregator_state()
     
     def _get_swap_data(self, from_token: str, to_token: str, amount: int, slippage: float = 1.0) -> Optional[Dict]:
         """
@@ -137,7 +150,7 @@ class OneInchAggregator:
             if self.api_key:
                 headers["Authorization"] = f"Bearer {self.api_key}"
             
-            response = requests.get(
+            response = http_session.get(
                 f"{self.api_base}/swap",
                 params=params,
                 headers=headers,
@@ -147,11 +160,11 @@ class OneInchAggregator:
             if response.status_code == 200:
                 return response.json()
             else:
-                print(f"[dim]1inch API error: {response.status_code} - {response.text[:100]}[/dim]")
+                logger.debug("1inch API error: %s - %s", response.status_code, response.text[:100])
                 return None
                 
         except Exception as e:
-            print(f"[dim]1inch API request failed: {e}[/dim]")
+            logger.debug("1inch API request failed: %s", e)
             return None
     
     def swap_eth_for_tokens(self, token_address: str, amount_eth: Decimal, slippage_percent: float = 1.0) -> Tuple[bool, str]:
@@ -167,13 +180,12 @@ class OneInchAggregator:
             (success, tx_hash or error)
         """
         try:
-            weth = "0x4200000000000000000000000000000000000006"
-            amount_wei = int(amount_eth * 10**18)
+            amount_wei = int(amount_eth.scaleb(18))
             
-            print(f"[dim]Getting 1inch quote for {amount_eth} ETH -> Token...[/dim]")
+            logger.debug("Getting 1inch quote for %s ETH -> Token...", amount_eth)
             
             # Get swap data from 1inch API
-            swap_data = self._get_swap_data(weth, token_address, amount_wei, slippage_percent)
+            swap_data = self._get_swap_data(WETH, token_address, amount_wei, slippage_percent)
             
             if not swap_data:
                 return False, "Failed to get swap data from 1inch API"
@@ -181,24 +193,24 @@ class OneInchAggregator:
             # Extract transaction data
             tx_data = swap_data.get("tx", {})
             
-            # Build transaction
+            # Build transaction (only ask the node for gas price if the API didn't quote one)
             tx = {
-                'to': self.w3.to_checksum_address(tx_data.get("to", ONEINCH_ROUTER)),
+                'to': to_checksum(tx_data.get("to", ONEINCH_ROUTER)),
                 'data': tx_data.get("data"),
                 'value': amount_wei,  # ETH amount
                 'gas': int(tx_data.get("gas", 300000)),
-                'gasPrice': int(tx_data.get("gasPrice", self.w3.eth.gas_price)),
+                'gasPrice': int(tx_data.get("gasPrice") or self._get_gas_price()),
                 'nonce': self.w3.eth.get_transaction_count(self.account.address),
                 'chainId': self.chain_id,
             }
             
-            print(f"[dim]Executing 1inch swap...[/dim]")
+            logger.debug("Executing 1inch swap...")
             
             # Sign and send
             signed = self.account.sign_transaction(tx)
             tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
             
-            print(f"[dim]TX: {self.w3.to_hex(tx_hash)}[/dim]")
+            logger.debug("TX: %s", self.w3.to_hex(tx_hash))
             
             # Wait for receipt
             receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
@@ -225,16 +237,16 @@ class OneInchAggregator:
             (success, tx_hash or error)
         """
         try:
-            weth = "0x4200000000000000000000000000000000000006"
-            amount_units = int(amount_tokens * (10 ** token_decimals))
+            amount_units = int(amount_tokens.scaleb(token_decimals))
+            
+            logger.debug("Getting 1inch quote for Token -> ETH...")
             
-            print(f"[dim]Getting 1inch quote for Token -> ETH...[/dim]")
+            # Gas price and nonce fetched once for both approve and swap
+            gas_price = self._get_gas_price()
+            nonce = self.w3.eth.get_transaction_count(self.account.address)
             
             # First approve 1inch router to spend tokens
-            token_contract = self.w3.eth.contract(
-                address=self.w3.to_checksum_address(token_address),
-                abi=ERC20_ABI
-            )
+            token_contract = self._get_token_contract(token_address)
             
             approve_tx = token_contract.functions.approve(
                 ONEINCH_ROUTER,
@@ -242,18 +254,18 @@ class OneInchAggregator:
             ).build_transaction({
                 'from': self.account.address,
                 'gas': 100000,
-                'gasPrice': self.w3.eth.gas_price,
-                'nonce': self.w3.eth.get_transaction_count(self.account.address),
+                'gasPrice': gas_price,
+                'nonce': nonce,
                 'chainId': self.chain_id,
             })
             
             signed_approve = self.account.sign_transaction(approve_tx)
             approve_hash = self.w3.eth.send_raw_transaction(signed_approve.raw_transaction)
             self.w3.eth.wait_for_transaction_receipt(approve_hash, timeout=120)
-            print(f"[dim]Approved 1inch to spend tokens[/dim]")
+            logger.debug("Approved 1inch to spend tokens")
             
             # Get swap data from 1inch API
-            swap_data = self._get_swap_data(token_address, weth, amount_units, slippage_percent)
+            swap_data = self._get_swap_data(token_address, WETH, amount_units, slippage_percent)
             
             if not swap_data:
                 return False, "Failed to get swap data from 1inch API"
@@ -263,22 +275,22 @@ class OneInchAggregator:
             
             # Build transaction
             tx = {
-                'to': self.w3.to_checksum_address(tx_data.get("to", ONEINCH_ROUTER)),
+                'to': to_checksum(tx_data.get("to", ONEINCH_ROUTER)),
                 'data': tx_data.get("data"),
                 'value': 0,  # No ETH sent for token->ETH
                 'gas': int(tx_data.get("gas", 300000)),
-                'gasPrice': int(tx_data.get("gasPrice", self.w3.eth.gas_price)),
-                'nonce': self.w3.eth.get_transaction_count(self.account.address),
+                'gasPrice': int(tx_data.get("gasPrice") or gas_price),
+                'nonce': nonce + 1,
                 'chainId': self.chain_id,
             }
             
-            print(f"[dim]Executing 1inch swap...[/dim]")
+            logger.debug("Executing 1inch swap...")
             
             # Sign and send
             signed = self.account.sign_transaction(tx)
             tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
             
-            print(f"[dim]TX: {self.w3.to_hex(tx_hash)}[/dim]")
+            logger.debug("TX: %s", self.w3.to_hex(tx_hash))
             
             # Wait for receipt
             receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
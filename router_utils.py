@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Router Helpers
+==============
+Small pieces shared by the aggregator routers, kept in one place so the
+0x and 1inch integrations do not each carry a copy.
+"""
+
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from web3 import Web3
+
+# Node gas price is reused across back-to-back txs for this long (Base blocks are ~2s)
+GAS_PRICE_TTL_SECONDS = 2.0
+
+
+def make_http_session() -> requests.Session:
+    """Keep-alive session with a connection pool, so repeated requests reuse one TCP/TLS connection."""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+    return session
+
+
+# Shared by the aggregator routers for their quote requests
+http_session = make_http_session()
+
+
+@lru_cache(maxsize=1024)
+def to_checksum(address: str) -> str:
+    """Checksum an address, memoized - the same spender/router/token recur every swap."""
+    return Web3.to_checksum_address(address)
+
+
+class AggregatorMixin:
+    """
+    Node reads shared by the aggregator routers.
+
+    Subclasses set `token_abi` and, in __init__, set `w3` and call
+    `_init_aggregator_state()`.
+    """
+
+    # ERC20 ABI used for token contracts - each router lists only what it calls
+    token_abi: Optional[List[Dict[str, Any]]] = None
+
+    def _init_aggregator_state(self):
+        """Start the gas price and token contract caches empty."""
+        self._gas_price = 0
+        self._gas_price_fetched_at = 0.0
+        # Token contracts by checksummed address
+        self._token_contracts: Dict[str, Any] = {}
+
+    def _get_gas_price(self) -> int:
+        """Node gas price, reused for a couple of seconds across back-to-back txs."""
+        now = time.monotonic()
+        if not self._gas_price or now - self._gas_price_fetched_at > GAS_PRICE_TTL_SECONDS:
+            self._gas_price = self.w3.eth.gas_price
+            self._gas_price_fetched_at = now
+        return self._gas_price
+
+    def _get_token_contract(self, token_address: str):
+        """ERC20 contract for a token, built once and reused across swaps."""
+        token_address = to_checksum(token_address)
+        contract = self._token_contracts.get(token_address)
+        if contract is None:
+            contract = self.w3.eth.contract(address=token_address, abi=self.token_abi)
+            self._token_contracts[token_address] = contract
+        return contract
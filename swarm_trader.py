@@ -17,6 +17,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 
+from eth_abi import decode
 from web3 import Web3
 from rich.table import Table
 from rich.console import Console
@@ -31,6 +32,7 @@ from swarm_wallet import (
 from trader import ComputeTrader
 from wallet import SecureWallet
 from config import Config
+from calldata import BALANCE_OF_SELECTOR, BALANCE_OF_ARGS_ENCODER, UINT256_RESULT_TYPES
 from utils import logger, format_eth, format_address
 
 # Import 0x router for swarm trading
@@ -147,6 +149,14 @@ class SwarmTrader:
         
         # Router type - default to 0x for swarm
         self.router_type = getattr(base_config, 'router_type', '0x')
+        
+        # Token the swarm trades, checksummed once instead of on every buy/sell
+        token_address = getattr(base_config, 'quote_token', getattr(base_config, 'compute_token', None))
+        self.token_address = Web3.to_checksum_address(token_address) if token_address else None
+        
+        # Token contract and decimals for sells, built/read on first use
+        self._token_contract = None
+        self._token_decimals: Optional[int] = None
     
     def _get_trader_for_wallet(self, wallet_index: int) -> ComputeTrader:
         """
@@ -246,12 +256,14 @@ class SwarmTrader:
             
             # Use 0x router if configured
             buy_amount = getattr(self.base_config, 'buy_amount', getattr(self.base_config, 'buy_amount_eth', 0.002))
-            token_address = getattr(self.base_config, 'quote_token', getattr(self.base_config, 'compute_token', None))
+            token_address = self.token_address
             
             if self.router_type == "0x":
                 # Use 0x aggregator
                 zerox = self._get_zerox_for_wallet(wallet_index)
-                success, tx_hash = zerox.swap_eth_for_tokens(
+                # Blocking send + receipt wait runs off the event loop
+                success, tx_hash = await asyncio.to_thread(
+                    zerox.swap_eth_for_tokens,
                     token_address=token_address,
                     amount_eth=Decimal(str(buy_amount)),
                     slippage_percent=self.base_config.slippage_percent
@@ -341,22 +353,26 @@ class SwarmTrader:
                 # Find wallet with highest token balance
                 best_wallet = None
                 best_balance = 0
-                token_address = getattr(self.base_config, 'quote_token', getattr(self.base_config, 'compute_token', None))
+                token_address = self.token_address
                 
-                for wallet in self.swarm_manager.wallets:
-                    # Check token balance
-                    token_contract = self.web3.eth.contract(
-                        address=self.web3.to_checksum_address(token_address),
-                        abi=[{"constant":True,"inputs":[{"name":"_owner","type":"address"}],"name":"balanceOf","outputs":[{"name":"balance","type":"uint256"}],"type":"function"}]
-                    )
+                def raw_token_balance(wallet: SwarmWallet) -> int:
+                    # Raw balanceOf eth_call - skips building a ContractFunction per wallet
                     try:
-                        bal = token_contract.functions.balanceOf(wallet.address).call()
-                        # Get decimals
-                        decimals = token_contract.functions.decimals().call()
-                        token_bal = bal / (10 ** decimals)
-                    except:
-                        token_bal = 0
-                    
+                        data = BALANCE_OF_SELECTOR + BALANCE_OF_ARGS_ENCODER((wallet.address,))
+                        raw = self.web3.eth.call({'to': token_address, 'data': data})
+                    except Exception:
+                        return 0
+                    # Empty return data means no balance to read - skip the decode
+                    return decode(UINT256_RESULT_TYPES, raw)[0] if len(raw) >= 32 else 0
+                
+                # Balance reads are independent - run them concurrently. Same token
+                # for every wallet, so raw units compare correctly without decimals.
+                wallets = list(self.swarm_manager.wallets)
+                balances = await asyncio.gather(
+                    *(asyncio.to_thread(raw_token_balance, wallet) for wallet in wallets)
+                )
+                
+                for wallet, token_bal in zip(wallets, balances):
                     if token_bal > best_balance:
                         best_balance = token_bal
                         best_wallet = wallet
@@ -378,30 +394,36 @@ class SwarmTrader:
             logger.info(f"Executing sell with wallet {wallet_index}: {format_address(account.address)}")
             
             # Use 0x router if configured
-            token_address = getattr(self.base_config, 'quote_token', getattr(self.base_config, 'compute_token', None))
+            token_address = self.token_address
             
             if self.router_type == "0x":
                 # Use 0x aggregator
                 zerox = self._get_zerox_for_wallet(wallet_index)
                 
                 # Get token balance
-                token_contract = self.web3.eth.contract(
-                    address=self.web3.to_checksum_address(token_address),
-                    abi=[{"constant":True,"inputs":[{"name":"_owner","type":"address"}],"name":"balanceOf","outputs":[{"name":"balance","type":"uint256"}],"type":"function"},{"constant":True,"inputs":[],"name":"decimals","outputs":[{"name":"","type":"uint8"}],"type":"function"}]
-                )
+                if self._token_contract is None:
+                    self._token_contract = self.web3.eth.contract(
+                        address=token_address,
+                        abi=[{"constant":True,"inputs":[{"name":"_owner","type":"address"}],"name":"balanceOf","outputs":[{"name":"balance","type":"uint256"}],"type":"function"},{"constant":True,"inputs":[],"name":"decimals","outputs":[{"name":"","type":"uint8"}],"type":"function"}]
+                    )
+                token_contract = self._token_contract
                 token_balance_raw = token_contract.functions.balanceOf(account.address).call()
-                token_decimals = token_contract.functions.decimals().call()
-                token_balance = Decimal(token_balance_raw) / Decimal(10 ** token_decimals)
+                if self._token_decimals is None:
+                    self._token_decimals = token_contract.functions.decimals().call()
+                token_decimals = self._token_decimals
+                token_balance = Decimal(token_balance_raw).scaleb(-token_decimals)
                 
                 # Get ETH balance before
                 eth_before = self.web3.from_wei(self.web3.eth.get_balance(account.address), 'ether')
                 
-                # Execute sell
-                success, tx_hash = zerox.swap_tokens_for_eth(
+                # Execute sell (blocking send + receipt wait runs off the event loop)
+                success, tx_hash = await asyncio.to_thread(
+                    zerox.swap_tokens_for_eth,
                     token_address=token_address,
                     amount_tokens=token_balance,
                     token_decimals=token_decimals,
-                    slippage_percent=self.base_config.slippage_percent
+                    slippage_percent=self.base_config.slippage_percent,
+                    amount_units=token_balance_raw
                 )
                 
                 # Get ETH balance after
@@ -23,6 +23,7 @@ import base64
 import hashlib
 import secrets
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Tuple, Any
 from dataclasses import dataclass, asdict, field
 from datetime import datetime
@@ -36,6 +37,9 @@ from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
 from utils import logger, format_address, validate_address, mask_sensitive
 
+# Max concurrent RPC reads when scanning balances across the swarm
+BALANCE_SCAN_WORKERS = 8
+
 
 class RotationMode(Enum):
     """Wallet rotation strategies."""
@@ -337,6 +341,21 @@ class SecureSwarmManager:
             logger.error(f"Failed to get balance for {address}: {e}")
             return 0.0, 0.0
     
+    def _get_wallet_balances(self, addresses: List[str]) -> List[Tuple[float, float]]:
+        """
+        Get ETH and COMPUTE balances for many addresses concurrently.
+        
+        Each lookup is independent RPC I/O, so a small thread pool collapses
+        N sequential round trips into roughly the slowest one.
+        
+        Returns:
+            List of (eth_balance, compute_balance), in the order of `addresses`
+        """
+        if not addresses:
+            return []
+        with ThreadPoolExecutor(max_workers=min(BALANCE_SCAN_WORKERS, len(addresses))) as pool:
+            return list(pool.map(self._get_wallet_balance, addresses))
+    
     def _get_erc20_balance(self, address: str) -> float:
         """Get COMPUTE token balance for an address."""
         try:
@@ -488,7 +507,7 @@ class SecureSwarmManager:
             
         elif self.config.rotation_mode == RotationMode.BALANCE_BASED:
             # Find wallet with highest ETH balance
-            balances = [self._get_wallet_balance(w.address)[0] for w in self.wallets]
+            balances = [eth for eth, _ in self._get_wallet_balances([w.address for w in self.wallets])]
             index = balances.index(max(balances))
             
         else:
@@ -867,8 +886,8 @@ class SecureSwarmManager:
         total_eth = 0.0
         total_compute = 0.0
         
-        for wallet in self.wallets:
-            eth_balance, compute_balance = self._get_wallet_balance(wallet.address)
+        balances = self._get_wallet_balances([w.address for w in self.wallets])
+        for wallet, (eth_balance, compute_balance) in zip(self.wallets, balances):
             total_eth += eth_balance
             total_compute += compute_balance
             
@@ -904,8 +923,8 @@ class SecureSwarmManager:
         """
         non_zero = []
         
-        for wallet in self.wallets:
-            eth_balance, compute_balance = self._get_wallet_balance(wallet.address)
+        balances = self._get_wallet_balances([w.address for w in self.wallets])
+        for wallet, (eth_balance, compute_balance) in zip(self.wallets, balances):
             
             # Allow small dust amounts for ETH (gas reserve)
             if eth_balance > self.config.min_eth_per_wallet * 2:
@@ -952,8 +971,8 @@ class SecureSwarmManager:
         
         # Step 1: Sell all tokens for ETH (if any tokens exist)
         logger.info("Step 1: Liquidating all tokens...")
-        for wallet in self.wallets:
-            eth_bal, comp_bal = self._get_wallet_balance(wallet.address)
+        balances = self._get_wallet_balances([w.address for w in self.wallets])
+        for wallet, (eth_bal, comp_bal) in zip(self.wallets, balances):
             if comp_bal > 0:
                 logger.info(f"Wallet {wallet.index}: Selling {comp_bal} COMPUTE...")
                 # Token liquidation would go here - simplified for now
@@ -10,8 +10,9 @@ import os
 import sys
 import unittest
 import tempfile
+from decimal import Decimal
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -174,6 +175,335 @@ class TestTrader(unittest.TestCase):
         
         self.assertTrue(result.success)
         self.assertEqual(result.gas_used, 150000)
+    
+    def test_min_amount_out_integer_math(self):
+        """Test slippage floor stays exact for amounts above 2**53."""
+        from trader import ComputeTrader
+        
+        trader = ComputeTrader.__new__(ComputeTrader)
+        self.assertEqual(trader._calculate_min_amount_out(10000, 2.0), 9800)
+        self.assertEqual(trader._calculate_min_amount_out(10000, 0.5), 9950)
+        
+        expected = 10**30 + 7
+        self.assertEqual(trader._calculate_min_amount_out(expected, 1.0), (expected * 9900) // 10000)
+    
+    def test_buy_retries_reverted_swap_three_times(self):
+        """Test a reverted buy is retried three times, 2s apart, whatever config.max_retries says."""
+        import asyncio
+        from trader import ComputeTrader
+        
+        trader = ComputeTrader.__new__(ComputeTrader)
+        trader.config = Mock(
+            dry_run=False, max_retries=0, buy_amount_eth=0.001,
+            slippage_percent=2.0, gas_limit_buffer=1.2, pool_fee=3000,
+        )
+        trader.weth = "0x" + "42" * 20
+        trader.compute = "0x" + "34" * 20
+        trader.total_trades = trader.successful_trades = 0
+        trader.total_gas_spent_eth = 0.0
+        trader._check_gas_price = Mock(return_value=True)
+        trader._quote_exact_input = AsyncMock(return_value=10**18)
+        trader.web3 = MagicMock()
+        trader.web3.to_wei.return_value = 10**15
+        trader.web3.from_wei.return_value = 0
+        trader.web3.eth.estimate_gas.return_value = 150000
+        trader.router = MagicMock()
+        trader.router.functions.exactInputSingle.return_value.build_transaction.side_effect = dict
+        trader.gas_optimizer = Mock(get_optimal_gas_price=Mock(return_value=10**7))
+        trader.wallet = Mock(address="0x" + "12" * 20)
+        trader.wallet.send_raw_transaction.return_value = "0xabc"
+        trader.wallet.wait_for_transaction.return_value = {'status': 0, 'gasUsed': 150000, 'blockNumber': 1}
+        
+        with patch("utils.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            result = asyncio.run(trader.buy())
+        
+        self.assertFalse(result["success"])
+        self.assertIn("0xabc", result["error"])
+        self.assertEqual(trader.wallet.send_raw_transaction.call_count, 3)
+        self.assertEqual([c[0][0] for c in sleep.call_args_list], [2.0, 2.0])
+
+class TestDexRouter(unittest.TestCase):
+    """Test MultiDEXRouter transaction plumbing (mocked provider)."""
+    
+    # Digit-only addresses are already checksummed, as web3's encoders require
+    SENDER = "0x" + "12" * 20
+    TOKEN = "0x" + "34" * 20
+    ROUTER = "0x" + "56" * 20
+    
+    def _make_router(self):
+        from dex_router import MultiDEXRouter
+        
+        router = MultiDEXRouter.__new__(MultiDEXRouter)
+        router.w3 = MagicMock()
+        router.account = Mock(address=self.SENDER)
+        router.best_dex = "uniswap_v2"
+        router._gas_cache = {}
+        return router
+    
+    def test_gas_estimate_is_sent_from_account(self):
+        """Test the cached gas estimate simulates the swap from our own address."""
+        from dex_router import GAS_ESTIMATE_BUFFER
+        
+        router = self._make_router()
+        router.w3.eth.estimate_gas.return_value = 100000
+        tx = router._build_call_tx("0x" + "11" * 20, b"\x12\x34", {}, 5, gas=300000)
+        
+        router._apply_cached_gas(tx, "sell")
+        
+        params = router.w3.eth.estimate_gas.call_args[0][0]
+        self.assertEqual(params['from'], self.SENDER)
+        self.assertNotIn('gas', params)
+        self.assertEqual(tx['gas'], int(100000 * GAS_ESTIMATE_BUFFER))
+        
+        # Second swap of the same shape reuses the estimate
+        router._apply_cached_gas(router._build_call_tx("0x" + "11" * 20, b"", {}, 6), "sell")
+        self.assertEqual(router.w3.eth.estimate_gas.call_count, 1)
+    
+    def test_reverted_approval_is_not_cached(self):
+        """Test a reverted approve raises instead of caching a MAX allowance."""
+        router = self._make_router()
+        router._allowance_cache = {}
+        router.token = Mock(address=self.TOKEN)
+        router.token.functions.allowance.return_value.call.return_value = 0
+        router._send_tx = Mock(return_value=b"\x01" * 32)
+        router._wait_for_receipt = Mock(return_value={'status': 0})
+        
+        with self.assertRaises(RuntimeError):
+            router._ensure_token_approval(self.ROUTER, 10**18, {}, 7)
+        self.assertEqual(router._allowance_cache, {})
+    
+    def _make_v2_sell_router(self):
+        """Router ready to sell on V2 with the router allowance already cached."""
+        from calldata import MAX_UINT256
+        
+        router = self._make_router()
+        router.token = Mock(address=self.TOKEN)
+        router.token_decimals = 18
+        router._allowance_cache = {(self.TOKEN, self.ROUTER): MAX_UINT256}
+        router._sell_path = [self.TOKEN, "0x" + "42" * 20]
+        router.routers = {"uniswap_v2": {
+            "contract": MagicMock(),
+            "config": {"type": "uniswap_v2", "router": self.ROUTER},
+        }}
+        router.routers["uniswap_v2"]["contract"].functions.getAmountsOut.return_value.call.return_value = [10**18, 10**15]
+        router._get_swap_context = Mock(return_value=({}, 3))
+        router.w3.eth.estimate_gas.return_value = 150000
+        return router
+    
+    def test_reverted_sell_drops_cached_allowance(self):
+        """Test a reverted sell forgets the router allowance so the next sell re-reads it."""
+        router = self._make_v2_sell_router()
+        router._send_tx = Mock(return_value=b"\x02" * 32)
+        router._wait_for_receipt = Mock(return_value={'status': 0})
+        
+        success, _ = router.swap_tokens_for_eth(Decimal("1"))
+        
+        self.assertFalse(success)
+        self.assertNotIn((self.TOKEN, self.ROUTER), router._allowance_cache)
+        self.assertEqual(router._gas_cache, {})
+    
+    def test_swap_revert_drops_only_that_allowance(self):
+        """Test a reverted swap forgets gas estimates and the spent token's allowance only."""
+        from calldata import MAX_UINT256
+        
+        router = self._make_router()
+        weth = Mock(address="0x" + "42" * 20)
+        router._gas_cache = {("uniswap_v3", "buy"): 200000}
+        router._allowance_cache = {
+            (weth.address, self.ROUTER): MAX_UINT256,
+            (self.TOKEN, self.ROUTER): MAX_UINT256,
+        }
+        
+        success, message = router._on_swap_revert("V3 ETH->Token", {'status': 0}, "0xabc", weth, self.ROUTER)
+        
+        self.assertFalse(success)
+        self.assertEqual(message, "V3 ETH->Token failed (status=0) - TX: 0xabc")
+        self.assertEqual(router._gas_cache, {})
+        self.assertEqual(list(router._allowance_cache), [(self.TOKEN, self.ROUTER)])
+    
+    def test_nonce_advances_after_send(self):
+        """Test the nonce is read from the node once, then tracked locally."""
+        router = self._make_router()
+        router._nonce = None
+        router.w3.eth.get_transaction_count.return_value = 5
+        
+        nonce = router._get_nonce()
+        router._send_tx(router._build_call_tx(self.ROUTER, b"", {}, nonce))
+        
+        self.assertEqual(nonce, 5)
+        self.assertEqual(router._get_nonce(), 6)
+        router.w3.eth.get_transaction_count.assert_called_once_with(self.SENDER, 'pending')
+        self.assertEqual(router.account.sign_transaction.call_args[0][0]['nonce'], 5)
+    
+    def test_nonce_resets_on_swap_error(self):
+        """Test a failed swap drops the local nonce so the next one refetches it."""
+        router = self._make_v2_sell_router()
+        router._nonce = 4
+        router._send_tx = Mock(side_effect=ValueError("nonce too low"))
+        
+        success, message = router.swap_tokens_for_eth(Decimal("1"))
+        
+        self.assertFalse(success)
+        self.assertIn("nonce too low", message)
+        self.assertIsNone(router._nonce)
+    
+    def _assert_matches_abi(self, abi, fn_name, data, args):
+        """Hand-encoded calldata must equal what web3 would build from the ABI."""
+        from web3 import Web3
+        
+        contract = Web3().eth.contract(abi=abi)
+        self.assertEqual(Web3.to_hex(data), contract.encode_abi(fn_name, args=args))
+    
+    def test_v2_calldata_matches_abi(self):
+        """Test the hand-encoded V2 swap calldata against the router ABI."""
+        import dex_router as dr
+        
+        path = [self.TOKEN, "0x" + "42" * 20]
+        buy_args = [123, path, self.SENDER, 1700000000]
+        sell_args = [10**18, 456, path, self.SENDER, 1700000000]
+        
+        self._assert_matches_abi(
+            dr.UNISWAP_V2_ROUTER_ABI, "swapExactETHForTokens",
+            dr.V2_SWAP_EXACT_ETH_FOR_TOKENS_SELECTOR + dr.V2_SWAP_EXACT_ETH_FOR_TOKENS_ARGS_ENCODER(tuple(buy_args)),
+            buy_args,
+        )
+        self._assert_matches_abi(
+            dr.UNISWAP_V2_ROUTER_ABI, "swapExactTokensForETH",
+            dr.V2_SWAP_EXACT_TOKENS_FOR_ETH_SELECTOR + dr.V2_SWAP_EXACT_TOKENS_FOR_ETH_ARGS_ENCODER(tuple(sell_args)),
+            sell_args,
+        )
+    
+    def test_aerodrome_calldata_matches_abi(self):
+        """Test the hand-encoded Aerodrome swap calldata against the router ABI."""
+        import dex_router as dr
+        
+        factory = "0x" + "78" * 20
+        routes = [(self.TOKEN, "0x" + "42" * 20, False, factory)]
+        buy_args = [123, routes, self.SENDER, 1700000000]
+        sell_args = [10**18, 456, routes, self.SENDER, 1700000000]
+        
+        self._assert_matches_abi(
+            dr.AERODROME_ROUTER_ABI, "swapExactETHForTokens",
+            dr.AERODROME_SWAP_EXACT_ETH_FOR_TOKENS_SELECTOR
+            + dr.AERODROME_SWAP_EXACT_ETH_FOR_TOKENS_ARGS_ENCODER(tuple(buy_args)),
+            buy_args,
+        )
+        self._assert_matches_abi(
+            dr.AERODROME_ROUTER_ABI, "swapExactTokensForETH",
+            dr.AERODROME_SWAP_EXACT_TOKENS_FOR_ETH_SELECTOR
+            + dr.AERODROME_SWAP_EXACT_TOKENS_FOR_ETH_ARGS_ENCODER(tuple(sell_args)),
+            sell_args,
+        )
+    
+    def test_exact_input_single_calldata_matches_abi(self):
+        """Test the hand-encoded V3 exactInputSingle calldata against the router ABI."""
+        import calldata
+        from dex_router import UNISWAP_V3_ROUTER_ABI
+        
+        params = (self.TOKEN, "0x" + "42" * 20, 3000, self.SENDER, 1700000000, 10**18, 456, 0)
+        
+        self._assert_matches_abi(
+            UNISWAP_V3_ROUTER_ABI, "exactInputSingle",
+            calldata.EXACT_INPUT_SINGLE_SELECTOR + calldata.EXACT_INPUT_SINGLE_ARGS_ENCODER((params,)),
+            [params],
+        )
+        # The named struct fields line up with the ABI's components
+        components = UNISWAP_V3_ROUTER_ABI[0]["inputs"][0]["components"]
+        self.assertEqual(tuple(c["name"] for c in components), calldata.EXACT_INPUT_SINGLE_FIELDS)
+
+
+class TestZeroXAggregator(unittest.TestCase):
+    """Test 0x sells against a mocked provider."""
+    
+    SENDER = "0x" + "ab" * 20
+    TOKEN = "0x" + "cd" * 20
+    SPENDER = "0x000000000022D473030F116dDEE9F6B43aC78BA3"
+    AMOUNT = 10**18
+    
+    def _make_aggregator(self, allowance=0):
+        from zerox_router import ZeroXAggregator
+        
+        agg = ZeroXAggregator.__new__(ZeroXAggregator)
+        agg.w3 = MagicMock()
+        agg.account = Mock(address=self.SENDER)
+        agg.chain_id = 8453
+        agg._allowance_cache = {}
+        agg._get_gas_price = Mock(return_value=10**7)
+        agg._get_allowance_holder_quote = Mock(return_value={
+            'issues': {'allowance': {'spender': self.SPENDER}},
+            'transaction': {'to': self.SPENDER, 'data': "0x1234", 'gas': "250000", 'gasPrice': "10000000"},
+        })
+        
+        self.token = Mock(address=self.TOKEN)
+        self.token.functions.allowance.return_value.call.return_value = allowance
+        self.token.functions.approve.return_value.build_transaction.side_effect = dict
+        agg._get_token_contract = Mock(return_value=self.token)
+        
+        agg.w3.eth.get_transaction_count.return_value = 9
+        agg.w3.eth.wait_for_transaction_receipt.return_value = {'status': 1, 'gasUsed': 150000}
+        return agg
+    
+    def _sell(self, agg):
+        return agg.swap_tokens_for_eth(self.TOKEN, Decimal("1"), amount_units=self.AMOUNT)
+    
+    def test_logs_through_configured_bot_logger(self):
+        """Test router log lines reach the handlers utils.setup_logging installs."""
+        import oneinch_router
+        import zerox_router
+        from utils import logger
+        
+        self.assertIs(zerox_router.logger.parent, logger)
+        self.assertIs(oneinch_router.logger.parent, logger)
+    
+    def test_allowance_decremented_after_sell(self):
+        """Test the allowance is read once and then tracked locally across sells."""
+        agg = self._make_aggregator(allowance=3 * self.AMOUNT)
+        key = (self.TOKEN, self.SPENDER)
+        
+        self.assertTrue(self._sell(agg)[0])
+        self.assertEqual(agg._allowance_cache[key], 2 * self.AMOUNT)
+        self.assertTrue(self._sell(agg)[0])
+        self.assertEqual(agg._allowance_cache[key], self.AMOUNT)
+        
+        self.token.functions.allowance.return_value.call.assert_called_once()
+        self.token.functions.approve.assert_not_called()
+    
+    def test_allowance_dropped_after_revert(self):
+        """Test a reverted sell forgets the tracked allowance."""
+        agg = self._make_aggregator()
+        key = (self.TOKEN, self.SPENDER)
+        agg._allowance_cache[key] = 3 * self.AMOUNT
+        agg.w3.eth.wait_for_transaction_receipt.return_value = {'status': 0, 'gasUsed': 150000}
+        
+        self.assertFalse(self._sell(agg)[0])
+        self.assertNotIn(key, agg._allowance_cache)
+    
+    def test_allowance_dropped_after_error(self):
+        """Test a sell that raises forgets the tracked allowance."""
+        agg = self._make_aggregator()
+        key = (self.TOKEN, self.SPENDER)
+        agg._allowance_cache[key] = 3 * self.AMOUNT
+        agg.w3.eth.send_raw_transaction.side_effect = ValueError("replacement underpriced")
+        
+        success, message = self._sell(agg)
+        
+        self.assertFalse(success)
+        self.assertIn("replacement underpriced", message)
+        self.assertNotIn(key, agg._allowance_cache)
+    
+    def test_approve_pipelined_with_swap(self):
+        """Test the approve goes out at the pending nonce and the swap right behind it."""
+        agg = self._make_aggregator(allowance=0)
+        
+        self.assertTrue(self._sell(agg)[0])
+        
+        signed = [c[0][0] for c in agg.account.sign_transaction.call_args_list]
+        self.assertEqual([tx['nonce'] for tx in signed], [9, 10])
+        self.assertEqual(signed[1]['to'], self.SPENDER)
+        agg.w3.eth.get_transaction_count.assert_called_once_with(self.SENDER, 'pending')
+        # Only the swap receipt is awaited - the approve is not waited on
+        agg.w3.eth.wait_for_transaction_receipt.assert_called_once()
+        self.assertEqual(agg._allowance_cache[(self.TOKEN, self.SPENDER)], 0)
 
 
 def run_tests():
@@ -186,6 +516,8 @@ def run_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestUtils))
     suite.addTests(loader.loadTestsFromTestCase(TestWallet))
     suite.addTests(loader.loadTestsFromTestCase(TestTrader))
+    suite.addTests(loader.loadTestsFromTestCase(TestDexRouter))
+    suite.addTests(loader.loadTestsFromTestCase(TestZeroXAggregator))
     
     runner = unittest.TextTestRunner(verbosity=2)
     result = runner.run(suite)
@@ -14,14 +14,24 @@ from decimal import Decimal
 
 from web3 import Web3
 from web3.types import TxParams, Wei
-from eth_abi import encode
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from eth_abi.registry import registry as abi_registry
 
 from config import Config
 from wallet import SecureWallet
-from utils import logger, GasOptimizer, TransactionError
+from utils import logger, GasOptimizer, TransactionError, async_retry_with_backoff
+from calldata import (
+    DECIMALS_SELECTOR,
+    EXACT_INPUT_SINGLE_ARGS_ENCODER,
+    EXACT_INPUT_SINGLE_FIELDS,
+    EXACT_INPUT_SINGLE_SELECTOR,
+    MAX_UINT256,
+)
 
 
+# Buy/sell attempts on TransactionError, with a flat delay between them
+TRADE_ATTEMPTS = 3
+TRADE_RETRY_DELAY_SECONDS = 2.0
+
 # Uniswap V3 Router ABI (simplified - exactInputSingle and multicall)
 UNISWAP_V3_ROUTER_ABI = [
     {
@@ -126,6 +136,27 @@ ERC20_ABI = [
     }
 ]
 
+# unwrapWETH9(uint256 amountMinimum, address recipient) - encoded by hand for the sell multicall
+UNWRAP_WETH9_SELECTOR = bytes.fromhex("49404b7c")
+UNWRAP_WETH9_ARGS_ENCODER = abi_registry.get_encoder("(uint256,address)")
+
+# Uniswap V3 Quoter ABI (quoteExactInputSingle only)
+QUOTER_ABI = [
+    {
+        "inputs": [
+            {"internalType": "address", "name": "tokenIn", "type": "address"},
+            {"internalType": "address", "name": "tokenOut", "type": "address"},
+            {"internalType": "uint24", "name": "fee", "type": "uint24"},
+            {"internalType": "uint256", "name": "amountIn", "type": "uint256"},
+            {"internalType": "uint160", "name": "sqrtPriceLimitX96", "type": "uint160"}
+        ],
+        "name": "quoteExactInputSingle",
+        "outputs": [{"internalType": "uint256", "name": "amountOut", "type": "uint256"}],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    }
+]
+
 
 @dataclass
 class TradeResult:
@@ -161,6 +192,11 @@ class ComputeTrader:
             abi=ERC20_ABI
         )
         
+        self.quoter = self.web3.eth.contract(
+            address=self.web3.to_checksum_address(config.quoter_address),
+            abi=QUOTER_ABI
+        )
+        
         self.weth = self.web3.to_checksum_address(config.weth_address)
         self.compute = self.web3.to_checksum_address(config.compute_token)
         
@@ -206,10 +242,15 @@ class ComputeTrader:
         """Cache and return token decimals."""
         if token_address not in self._decimals_cache:
             try:
-                token = self.web3.eth.contract(address=token_address, abi=ERC20_ABI)
-                self._decimals_cache[token_address] = token.functions.decimals().call()
-            except:
-                self._decimals_cache[token_address] = 18
+                # Raw eth_call on the decimals() selector - no Contract object needed
+                result = self.web3.eth.call({'to': token_address, 'data': DECIMALS_SELECTOR})
+            except Exception as e:
+                logger.debug(f"decimals() call failed for {token_address}: {e}")
+                result = b""
+            # Tokens without decimals() return empty data - check it instead of raising
+            self._decimals_cache[token_address] = (
+                int.from_bytes(result[-32:], 'big') if len(result) >= 32 else 18
+            )
         return self._decimals_cache[token_address]
     
     def add_activity(self, action: str, amount: str, status: str):
@@ -261,22 +302,34 @@ class ComputeTrader:
         slippage_percent: float
     ) -> int:
         """Calculate minimum output with slippage protection."""
-        slippage_factor = 1 - (slippage_percent / 100)
-        return int(expected_amount * slippage_factor)
+        # Integer basis points - exact even when expected_amount exceeds 2**53
+        bps = int(round((100 - slippage_percent) * 100))
+        return (expected_amount * bps) // 10000
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(TransactionError),
-        reraise=True
-    )
     async def buy(self) -> Dict[str, Any]:
         """
         Execute a buy order (ETH -> COMPUTE).
         
+        Up to TRADE_ATTEMPTS attempts, TRADE_RETRY_DELAY_SECONDS apart, while the
+        swap reverts (TransactionError).
+        
         Returns:
             Dict with success, tx_hash, and other trade details
         """
+        try:
+            return await async_retry_with_backoff(
+                self._buy_once,
+                max_retries=TRADE_ATTEMPTS,
+                base_delay=TRADE_RETRY_DELAY_SECONDS,
+                max_delay=TRADE_RETRY_DELAY_SECONDS,
+                exceptions=(TransactionError,)
+            )
+        except TransactionError as e:
+            logger.error(f"Buy failed after {TRADE_ATTEMPTS} attempts: {e}")
+            return {"success": False, "error": str(e)}
+    
+    async def _buy_once(self) -> Dict[str, Any]:
+        """Single buy attempt (see buy)."""
         if self.config.dry_run:
             logger.info("[DRY RUN] Would buy COMPUTE with ETH")
             return {"success": True, "tx_hash": "0xDRYRUN", "dry_run": True}
@@ -369,23 +422,37 @@ class ComputeTrader:
             else:
                 raise TransactionError(f"Transaction failed: {tx_hash}")
                 
+        except TransactionError:
+            # Reverted on chain - let the caller's retry loop try again
+            raise
         except Exception as e:
             logger.exception("Buy failed")
             return {"success": False, "error": str(e)}
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(TransactionError),
-        reraise=True
-    )
     async def sell_all(self) -> Dict[str, Any]:
         """
         Execute a sell order (sell all COMPUTE -> ETH).
         
+        Up to TRADE_ATTEMPTS attempts, TRADE_RETRY_DELAY_SECONDS apart, while the
+        swap reverts (TransactionError).
+        
         Returns:
             Dict with success, tx_hash, and other trade details
         """
+        try:
+            return await async_retry_with_backoff(
+                self._sell_all_once,
+                max_retries=TRADE_ATTEMPTS,
+                base_delay=TRADE_RETRY_DELAY_SECONDS,
+                max_delay=TRADE_RETRY_DELAY_SECONDS,
+                exceptions=(TransactionError,)
+            )
+        except TransactionError as e:
+            logger.error(f"Sell failed after {TRADE_ATTEMPTS} attempts: {e}")
+            return {"success": False, "error": str(e)}
+    
+    async def _sell_all_once(self) -> Dict[str, Any]:
+        """Single sell attempt (see sell_all)."""
         if self.config.dry_run:
             logger.info("[DRY RUN] Would sell all COMPUTE for ETH")
             return {"success": True, "tx_hash": "0xDRYRUN", "dry_run": True}
@@ -434,14 +501,12 @@ class ComputeTrader:
             
             # For selling tokens, we need to unwrap WETH to ETH
             # This requires a multicall: swap + unwrap
-            swap_data = self.router.encodeABI(
-                fn_name='exactInputSingle',
-                args=[params]
+            swap_data = EXACT_INPUT_SINGLE_SELECTOR + EXACT_INPUT_SINGLE_ARGS_ENCODER(
+                (tuple(params[field] for field in EXACT_INPUT_SINGLE_FIELDS),)
             )
             
-            unwrap_data = self.router.encodeABI(
-                fn_name='unwrapWETH9',
-                args=[amount_out_min, self.wallet.address]
+            unwrap_data = UNWRAP_WETH9_SELECTOR + UNWRAP_WETH9_ARGS_ENCODER(
+                (amount_out_min, self.wallet.address)
             )
             
             # Build multicall transaction
@@ -492,6 +557,9 @@ class ComputeTrader:
             else:
                 raise TransactionError(f"Transaction failed: {tx_hash}")
                 
+        except TransactionError:
+            # Reverted on chain - let the caller's retry loop try again
+            raise
         except Exception as e:
             logger.exception("Sell failed")
             return {"success": False, "error": str(e)}
@@ -506,9 +574,7 @@ class ComputeTrader:
             logger.info(f"Approving {spender} to spend tokens...")
             
             # Approve max uint256
-            max_uint = 2**256 - 1
-            
-            tx = token.functions.approve(spender, max_uint).build_transaction({
+            tx = token.functions.approve(spender, MAX_UINT256).build_transaction({
                 'from': self.wallet.address,
                 'nonce': self.wallet.get_nonce(),
                 'gas': 100000,
@@ -542,28 +608,7 @@ class ComputeTrader:
         # For now, return a placeholder that assumes price discovery
         try:
             # Try to use quoter contract if available
-            quoter_abi = [
-                {
-                    "inputs": [
-                        {"internalType": "address", "name": "tokenIn", "type": "address"},
-                        {"internalType": "address", "name": "tokenOut", "type": "address"},
-                        {"internalType": "uint24", "name": "fee", "type": "uint24"},
-                        {"internalType": "uint256", "name": "amountIn", "type": "uint256"},
-                        {"internalType": "uint160", "name": "sqrtPriceLimitX96", "type": "uint160"}
-                    ],
-                    "name": "quoteExactInputSingle",
-                    "outputs": [{"internalType": "uint256", "name": "amountOut", "type": "uint256"}],
-                    "stateMutability": "nonpayable",
-                    "type": "function"
-                }
-            ]
-            
-            quoter = self.web3.eth.contract(
-                address=self.web3.to_checksum_address(self.config.quoter_address),
-                abi=quoter_abi
-            )
-            
-            amount_out = quoter.functions.quoteExactInputSingle(
+            amount_out = self.quoter.functions.quoteExactInputSingle(
                 token_in,
                 token_out,
                 self.config.pool_fee,
@@ -4,6 +4,7 @@ Utility Module
 Helper functions, gas optimization, logging, and formatting utilities.
 """
 
+import asyncio
 import os
 import sys
 import logging
@@ -334,8 +335,6 @@ async def async_retry_with_backoff(
     exceptions: tuple = (Exception,)
 ):
     """Async retry with exponential backoff."""
-    import asyncio
-    
     for attempt in range(max_retries):
         try:
             return await func()
@@ -10,16 +10,19 @@ This is a fallback when 0x aggregator is not available.
 Universal Router on Base: 0x6c083a36f731ea994739ef5e8647d18553d41f76
 """
 
+import logging
 from typing import Tuple
 from decimal import Decimal
 from web3 import Web3
 from eth_account import Account
 
+logger = logging.getLogger(__name__)
+
 # Universal Router address on Base
-UNIVERSAL_ROUTER = "0x6c083a36f731ea994739ef5e8647d18553d41f76"
+UNIVERSAL_ROUTER = Web3.to_checksum_address("0x6c083a36f731ea994739ef5e8647d18553d41f76")
 
 # WETH on Base
-WETH = "0x4200000000000000000000000000000000000006"
+WETH = Web3.to_checksum_address("0x4200000000000000000000000000000000000006")
 
 # WETH ABI (minimal)
 WETH_ABI = [
@@ -77,8 +80,8 @@ class V4DirectRouter:
     def __init__(self, w3: Web3, account: Account):
         self.w3 = w3
         self.account = account
-        self.weth = w3.to_checksum_address(WETH)
-        self.router_address = w3.to_checksum_address(UNIVERSAL_ROUTER)
+        self.weth = WETH
+        self.router_address = UNIVERSAL_ROUTER
         
     def swap_eth_for_tokens(
         self,
@@ -92,10 +95,10 @@ class V4DirectRouter:
         Current implementation: Returns error directing to 0x aggregator.
         Full implementation needs V4 command encoding.
         """
-        print("[yellow]⚠ Direct V4 routing not implemented yet[/yellow]")
-        print("[dim]Please configure 0x aggregator for V4 tokens:[/dim]")
-        print("[dim]  1. Get API key from https://0x.org[/dim]")
-        print("[dim]  2. Add zerox_api_key to your config[/dim]")
+        logger.warning(
+            "Direct V4 routing not implemented yet - get an API key from "
+            "https://0x.org and add zerox_api_key to your config to route V4 tokens via 0x"
+        )
         return False, "Direct V4 not implemented - use 0x aggregator"
     
     def swap_tokens_for_eth(
@@ -106,5 +109,5 @@ class V4DirectRouter:
         slippage_percent: float = 2.0
     ) -> Tuple[bool, str]:
         """Swap tokens for ETH via V4."""
-        print("[yellow]⚠ Direct V4 routing not implemented yet[/yellow]")
+        logger.warning("Direct V4 routing not implemented yet")
         return False, "Direct V4 not implemented - use 0x aggregator"
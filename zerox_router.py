@@ -8,12 +8,18 @@ This is simpler than Permit2 - uses traditional token approvals.
 API Docs: https://0x.org/docs/0x-swap-api/guides/swap-tokens-with-0x-swap-api
 """
 
-import requests
+import logging
 from typing import Optional, Tuple, Dict, Any
 from decimal import Decimal
 from web3 import Web3
 from eth_account import Account
 
+from router_utils import AggregatorMixin, http_session, to_checksum
+
+# Child of the "compute_bot" logger that utils.setup_logging configures, so the swarm
+# path prints these lines and writes them to its log file; otherwise they propagate to root
+logger = logging.getLogger(f"compute_bot.{__name__}")
+
 ZEROX_API_BASE = "https://api.0x.org"
 ZEROX_CHAIN_ID = 8453
 
@@ -33,9 +39,11 @@ ERC20_ABI = [
 ]
 
 
-class ZeroXAggregator:
+class ZeroXAggregator(AggregatorMixin):
     """0x aggregator v2 Allowance Holder for Base."""
     
+    token_abi = ERC20_ABI
+    
     def __init__(self, w3: Web3, account: Account, api_key: Optional[str] = None):
         self.w3 = w3
         self.account = account
@@ -49,6 +57,11 @@ class ZeroXAggregator:
         }
         if api_key:
             self.headers["0x-api-key"] = api_key
+        
+        self._init_aggregator_state()
+        
+        # (token, spender) -> allowance left after our own approves and swaps
+        self._allowance_cache: Dict[Tuple[str, str], int] = {}
     
     def _get_allowance_holder_quote(self, sell_token: str, buy_token: str, sell_amount: int,
                                      slippage: float = 1.0) -> Optional[Dict]:
@@ -59,13 +72,13 @@ class ZeroXAggregator:
                 "sellToken": sell_token,
                 "buyToken": buy_token,
                 "sellAmount": str(sell_amount),
-                "slippageBps": str(int(slippage * 100)),  # basis points
+                "slippageBps": str(int(round(slippage * 100))),  # basis points (rounded, not truncated)
                 "taker": self.account.address,
             }
             
-            print(f"[dim]Calling 0x v2 Allowance Holder API...[/dim]")
+            logger.debug("Calling 0x v2 Allowance Holder API...")
             
-            response = requests.get(
+            response = http_session.get(
                 f"{ZEROX_API_BASE}/swap/allowance-holder/quote",
                 params=params,
                 headers=self.headers,
@@ -76,11 +89,11 @@ class ZeroXAggregator:
                 return response.json()
             else:
                 error_text = response.text[:500] if response.text else "Unknown error"
-                print(f"[yellow]0x API error: {response.status_code} - {error_text}[/yellow]")
+                logger.warning("0x API error: %s - %s", response.status_code, error_text)
                 return None
                 
         except Exception as e:
-            print(f"[yellow]0x API request failed: {e}[/yellow]")
+            logger.warning("0x API request failed: %s", e)
             return None
     
     def swap_eth_for_tokens(self, token_address: str, amount_eth: Decimal,
@@ -91,9 +104,9 @@ class ZeroXAggregator:
         No approvals needed for the sell side (ETH is native).
         """
         try:
-            amount_wei = int(amount_eth * 10**18)
+            amount_wei = int(amount_eth.scaleb(18))
             
-            print(f"[dim]Getting 0x Allowance Holder quote for {amount_eth} ETH -> Token...[/dim]")
+            logger.debug("Getting 0x Allowance Holder quote for %s ETH -> Token...", amount_eth)
             
             # Use ETH placeholder for native ETH
             quote = self._get_allowance_holder_quote(
@@ -106,65 +119,71 @@ class ZeroXAggregator:
             if not quote:
                 return False, "Failed to get quote from 0x API"
             
-            print(f"[green]✓ 0x route found![/green]")
-            print(f"[dim]  Expected output: {quote.get('buyAmount', 'N/A')}[/dim]")
-            print(f"[dim]  Liquidity available: {quote.get('liquidityAvailable', False)}[/dim]")
+            logger.info("0x route found")
+            logger.debug(
+                "Expected output: %s, liquidity available: %s",
+                quote.get('buyAmount', 'N/A'), quote.get('liquidityAvailable', False)
+            )
             
             # Check for issues
             issues = quote.get('issues', {})
             if issues:
                 allowance_issue = issues.get('allowance')
                 if allowance_issue:
-                    print(f"[dim]  Allowance required from: {allowance_issue.get('spender', 'N/A')}[/dim]")
+                    logger.debug("Allowance required from: %s", allowance_issue.get('spender', 'N/A'))
             
             # Get transaction data
             transaction = quote.get('transaction', {})
             if not transaction:
                 return False, "No transaction data in quote"
             
-            # Build transaction
+            # Build transaction (only ask the node for gas price if the quote has none)
             tx = {
-                'to': self.w3.to_checksum_address(transaction["to"]),
+                'to': to_checksum(transaction["to"]),
                 'data': transaction["data"],
                 'value': int(transaction.get("value", amount_wei)),  # ETH value to send
                 'gas': int(transaction.get("gas", 200000)),
-                'gasPrice': int(transaction.get("gasPrice", self.w3.eth.gas_price)),
+                'gasPrice': int(transaction.get("gasPrice") or self._get_gas_price()),
                 'nonce': self.w3.eth.get_transaction_count(self.account.address),
                 'chainId': self.chain_id,
             }
             
-            print(f"[dim]Executing 0x swap (sending {amount_eth} ETH)...[/dim]")
+            logger.debug("Executing 0x swap (sending %s ETH)...", amount_eth)
             
             signed = self.account.sign_transaction(tx)
             tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
             tx_hex = self.w3.to_hex(tx_hash)
             
-            print(f"[dim]TX: {tx_hex}[/dim]")
+            logger.debug("TX: %s", tx_hex)
             
             receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
             
             if receipt['status'] == 1:
-                print(f"[green]✓ 0x swap successful! Gas: {receipt['gasUsed']}[/green]")
+                logger.info("0x swap successful! Gas: %s", receipt['gasUsed'])
                 return True, tx_hex
             else:
                 return False, f"Transaction failed (status={receipt['status']})"
                 
         except Exception as e:
-            import traceback
-            print(f"[red]0x swap error: {e}[/red]")
-            print(f"[dim]{traceback.format_exc()[:300]}...[/dim]")
+            logger.error("0x swap error: %s", e)
+            logger.debug("0x swap traceback", exc_info=True)
             return False, f"0x swap error: {e}"
     
     def swap_tokens_for_eth(self, token_address: str, amount_tokens: Decimal,
-                           token_decimals: int = 18, slippage_percent: float = 1.0) -> Tuple[bool, str]:
+                           token_decimals: int = 18, slippage_percent: float = 1.0,
+                           amount_units: Optional[int] = None) -> Tuple[bool, str]:
         """Swap tokens for ETH via 0x v2 Allowance Holder.
         
         For Token -> ETH, we need to approve the specific spender returned by the quote.
+        Callers holding the raw on-chain amount can pass `amount_units` to skip the
+        Decimal conversion.
         """
+        allowance_key = None
         try:
-            amount_units = int(amount_tokens * (10 ** token_decimals))
+            if amount_units is None:
+                amount_units = int(amount_tokens.scaleb(token_decimals))
             
-            print(f"[dim]Getting 0x Allowance Holder quote for Token -> ETH...[/dim]")
+            logger.debug("Getting 0x Allowance Holder quote for Token -> ETH...")
             
             # Get quote FIRST to know which spender to approve
             quote = self._get_allowance_holder_quote(
@@ -177,7 +196,7 @@ class ZeroXAggregator:
             if not quote:
                 return False, "Failed to get quote from 0x API"
             
-            print(f"[green]✓ 0x route found![/green]")
+            logger.info("0x route found")
             
             # Get the allowance target from the quote (with fallback)
             issues = quote.get('issues') or {}
@@ -185,27 +204,29 @@ class ZeroXAggregator:
             allowance_target = allowance_issue.get('spender') or quote.get('allowanceTarget') or ALLOWANCE_HOLDER
             
             # CRITICAL: Checksum the address for web3.py
-            allowance_target = self.w3.to_checksum_address(allowance_target)
+            allowance_target = to_checksum(allowance_target)
             
-            print(f"[dim]  Allowance target: {allowance_target}[/dim]")
+            logger.debug("Allowance target: %s", allowance_target)
             
             # Setup token contract
-            token_contract = self.w3.eth.contract(
-                address=self.w3.to_checksum_address(token_address),
-                abi=ERC20_ABI
-            )
-            
-            # Check and approve the CORRECT allowance target
-            current_allowance = token_contract.functions.allowance(
-                self.account.address,
-                allowance_target
-            ).call()
+            token_contract = self._get_token_contract(token_address)
+            
+            # Use 'pending' nonce to avoid conflicts - fetched once, the swap follows the approve
+            nonce = self.w3.eth.get_transaction_count(self.account.address, 'pending')
+            
+            approve_hash = None
+            # Check and approve the CORRECT allowance target. Only this aggregator
+            # spends it, so after the first read the remaining allowance is tracked locally
+            allowance_key = (token_contract.address, allowance_target)
+            current_allowance = self._allowance_cache.get(allowance_key)
+            if current_allowance is None:
+                current_allowance = token_contract.functions.allowance(
+                    self.account.address,
+                    allowance_target
+                ).call()
             
             if current_allowance < amount_units:
-                print(f"[dim]Approving {allowance_target[:20]}... to spend tokens...[/dim]")
-                
-                # Use 'pending' nonce to avoid conflicts
-                approve_nonce = self.w3.eth.get_transaction_count(self.account.address, 'pending')
+                logger.debug("Approving %s to spend tokens...", allowance_target)
                 
                 approve_tx = token_contract.functions.approve(
                     allowance_target,
@@ -213,20 +234,20 @@ class ZeroXAggregator:
                 ).build_transaction({
                     'from': self.account.address,
                     'gas': 100000,
-                    'gasPrice': self.w3.eth.gas_price,
-                    'nonce': approve_nonce,
+                    'gasPrice': self._get_gas_price(),
+                    'nonce': nonce,
                     'chainId': self.chain_id,
                 })
                 
                 signed_approve = self.account.sign_transaction(approve_tx)
                 approve_hash = self.w3.eth.send_raw_transaction(signed_approve.raw_transaction)
-                self.w3.eth.wait_for_transaction_receipt(approve_hash, timeout=120)
-                print(f"[green]✓ Approved spender[/green]")
+                # Don't wait a block for the approve: the swap goes out right behind it at
+                # nonce + 1 and is mined after it. If the approve fails, the swap reverts.
+                logger.info("Approval sent: %s", self.w3.to_hex(approve_hash))
+                current_allowance = amount_units
+                nonce += 1
             else:
-                print(f"[dim]  Sufficient allowance already granted[/dim]")
-            
-            # Refresh nonce after approval (use 'pending' to get next available)
-            swap_nonce = self.w3.eth.get_transaction_count(self.account.address, 'pending')
+                logger.debug("Sufficient allowance already granted")
             
             # Get transaction data from quote
             transaction = quote.get('transaction', {})
@@ -234,12 +255,12 @@ class ZeroXAggregator:
                 return False, "No transaction data in quote"
             
             tx = {
-                'to': self.w3.to_checksum_address(transaction["to"]),
+                'to': to_checksum(transaction["to"]),
                 'data': transaction["data"],
                 'value': int(transaction.get("value", 0)),
                 'gas': int(transaction.get("gas", 200000)),
-                'gasPrice': int(transaction.get("gasPrice", self.w3.eth.gas_price)),
-                'nonce': swap_nonce,  # Use refreshed nonce after approval
+                'gasPrice': int(transaction.get("gasPrice") or self._get_gas_price()),
+                'nonce': nonce,
                 'chainId': self.chain_id,
             }
             
@@ -247,18 +268,26 @@ class ZeroXAggregator:
             tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
             tx_hex = self.w3.to_hex(tx_hash)
             
-            print(f"[dim]TX: {tx_hex}[/dim]")
+            logger.debug("TX: %s", tx_hex)
             
             receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
             
             if receipt['status'] == 1:
-                print(f"[green]✓ 0x swap successful! Gas: {receipt['gasUsed']}[/green]")
+                logger.info("0x swap successful! Gas: %s", receipt['gasUsed'])
+                self._allowance_cache[allowance_key] = max(0, current_allowance - amount_units)
                 return True, tx_hex
             else:
+                self._allowance_cache.pop(allowance_key, None)
+                if approve_hash is not None:
+                    approve_receipt = self.w3.eth.wait_for_transaction_receipt(approve_hash, timeout=120)
+                    if approve_receipt['status'] != 1:
+                        return False, f"Approval failed (status={approve_receipt['status']}), swap reverted"
                 return False, f"Transaction failed (status={receipt['status']})"
                 
         except Exception as e:
-            import traceback
-            print(f"[red]0x swap error: {e}[/red]")
-            print(f"[dim]{traceback.format_exc()[:300]}...[/dim]")
+            # Allowance state unknown after a failure - re-read it next time
+            if allowance_key:
+                self._allowance_cache.pop(allowance_key, None)
+            logger.error("0x swap error: %s", e)
+            logger.debug("0x swap traceback", exc_info=True)
             return False, f"0x swap error: {e}"